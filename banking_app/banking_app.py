@@ -1,23 +1,73 @@
 """Banking App - Frontend for Banking Transactions API."""
 
+import contextlib
+
 import reflex as rx
-from .pages.dashboard import dashboard
-from .pages.transactions import transactions
-from .pages.customers import customers
-from .pages.fraud import fraud
-
-
-# Create the Reflex app
-app = rx.App(
-    theme=rx.theme(
-        appearance="light",
-        accent_color="indigo",
-        radius="large",
-    ),
-)
-
-# Add routes
-app.add_page(dashboard, route="/", title="Dashboard - Banking App")
-app.add_page(transactions, route="/transactions", title="Transactions - Banking App")
-app.add_page(customers, route="/customers", title="Customers - Banking App")
-app.add_page(fraud, route="/fraud", title="Fraud Detection - Banking App")
+
+
+# Page factories: each page module is only imported when its route is compiled
+def _dashboard() -> rx.Component:
+    from .pages.dashboard import dashboard
+    return dashboard()
+
+
+def _transactions() -> rx.Component:
+    from .pages.transactions import transactions
+    return transactions()
+
+
+def _customers() -> rx.Component:
+    from .pages.customers import customers
+    return customers()
+
+
+def _fraud() -> rx.Component:
+    from .pages.fraud import fraud
+    return fraud()
+
+
+@contextlib.asynccontextmanager
+async def _close_api_client():
+    """Close the shared API client's connections when the server shuts down."""
+    yield
+    from .state.app_state import api_client
+    await api_client.close()
+
+
+async def _warmup_api_caches():
+    """Prefetch the slowly changing API data when the server starts."""
+    from .state.app_state import warmup_caches
+    await warmup_caches()
+
+
+def create_app() -> rx.App:
+    """Create the Reflex app and register its routes.
+
+    Returns:
+        Configured Reflex app
+    """
+    app = rx.App(
+        theme=rx.theme(
+            appearance="light",
+            accent_color="indigo",
+            radius="large",
+        ),
+    )
+
+    # Add routes
+    app.add_page(_dashboard, route="/", title="Dashboard - Banking App")
+    app.add_page(_transactions, route="/transactions", title="Transactions - Banking App")
+    app.add_page(_customers, route="/customers", title="Customers - Banking App")
+    app.add_page(_fraud, route="/fraud", title="Fraud Detection - Banking App")
+    app.register_lifespan_task(_warmup_api_caches)
+    app.register_lifespan_task(_close_api_client)
+    return app
+
+
+def __getattr__(name: str):
+    """Build the app lazily on first access to ``banking_app.banking_app.app``."""
+    if name == "app":
+        app = create_app()
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,28 @@
+"""Viewport visibility wrapper component."""
+
+import reflex as rx
+from reflex.event import EventHandler, passthrough_event_spec
+
+
+class InView(rx.NoSSRComponent):
+    """Wraps react-intersection-observer's InView.
+
+    Fires on_change with True once its children scroll into the viewport,
+    so sections below the fold can defer their data fetch.
+    """
+
+    library = "react-intersection-observer@9.13.1"
+
+    tag = "InView"
+
+    # Only report the first time the children become visible.
+    trigger_once: rx.Var[bool]
+
+    # Margin around the viewport, to start loading slightly before the section shows.
+    root_margin: rx.Var[str]
+
+    # Fired with the new visibility state.
+    on_change: EventHandler[passthrough_event_spec(bool)]
+
+
+in_view = InView.create
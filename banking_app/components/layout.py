@@ -3,14 +3,43 @@
 import reflex as rx
 from ..state.app_state import AppState
 
+# Navigation entries as (label, route)
+_NAV_ITEMS = (
+    ("Dashboard", "/"),
+    ("Transactions", "/transactions"),
+    ("Customers", "/customers"),
+    ("Fraud Detection", "/fraud"),
+)
 
+
+def _nav_link(label: str, href: str) -> rx.Component:
+    """Create a single navigation link."""
+    return rx.link(
+        rx.text(label, color="white", font_weight="500"),
+        href=href,
+        padding="0.5em 1em",
+        border_radius="6px",
+        _hover={"bg": "rgba(255,255,255,0.1)"},
+    )
+
+
+@rx.memo
+def _loading_bar() -> rx.Component:
+    """Create the global loading bar shown while data is being fetched."""
+    return rx.cond(
+        AppState.is_loading,
+        rx.progress(is_indeterminate=True, width="100%", position="fixed", top="0", z_index="9999", color_scheme="indigo"),
+    )
+
+
+@rx.memo
 def navbar() -> rx.Component:
-    """Create navigation bar component."""
+    """Create navigation bar component.
+
+    Memoized and independent of any state so it is compiled once and
+    skipped on unrelated state updates.
+    """
     return rx.box(
-        rx.cond(
-            AppState.is_loading,
-            rx.progress(is_indeterminate=True, width="100%", position="fixed", top="0", z_index="9999", color_scheme="indigo"),
-        ),
         rx.hstack(
             # Logo and title
             rx.hstack(
@@ -22,34 +51,7 @@ def navbar() -> rx.Component:
             rx.spacer(),
             # Navigation links
             rx.hstack(
-                rx.link(
-                    rx.text("Dashboard", color="white", font_weight="500"),
-                    href="/",
-                    padding="0.5em 1em",
-                    border_radius="6px",
-                    _hover={"bg": "rgba(255,255,255,0.1)"},
-                ),
-                rx.link(
-                    rx.text("Transactions", color="white", font_weight="500"),
-                    href="/transactions",
-                    padding="0.5em 1em",
-                    border_radius="6px",
-                    _hover={"bg": "rgba(255,255,255,0.1)"},
-                ),
-                rx.link(
-                    rx.text("Customers", color="white", font_weight="500"),
-                    href="/customers",
-                    padding="0.5em 1em",
-                    border_radius="6px",
-                    _hover={"bg": "rgba(255,255,255,0.1)"},
-                ),
-                rx.link(
-                    rx.text("Fraud Detection", color="white", font_weight="500"),
-                    href="/fraud",
-                    padding="0.5em 1em",
-                    border_radius="6px",
-                    _hover={"bg": "rgba(255,255,255,0.1)"},
-                ),
+                *[_nav_link(label, href) for label, href in _NAV_ITEMS],
                 spacing="4",
             ),
             width="100%",
@@ -65,6 +67,7 @@ def navbar() -> rx.Component:
     )
 
 
+@rx.memo
 def footer() -> rx.Component:
     """Create footer component."""
     return rx.box(
@@ -94,6 +97,7 @@ def base_layout(*children, **props) -> rx.Component:
         Complete page layout with navbar and footer
     """
     return rx.box(
+        _loading_bar(),
         navbar(),
         rx.box(
             *children,
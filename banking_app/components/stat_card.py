@@ -1,40 +1,44 @@
 """Reusable stat card component."""
 
 import reflex as rx
+from typing import Union
+from .styles import CARD_STYLE, CARD_HOVER
 
+# Icons stat cards can show, by the name pages pass -> lucide icon. rx.icon
+# needs a literal name, so the memoized card matches on the name instead of
+# resolving it at runtime.
+_STAT_CARD_ICONS = {
+    "activity": "activity",
+    "alert-octagon": "octagon_alert",
+    "alert-triangle": "triangle_alert",
+    "bar-chart-2": "bar_chart_2",
+    "credit-card": "credit_card",
+    "dollar-sign": "dollar_sign",
+    "users": "users",
+}
 
-def stat_card(title: str, value: str, icon_name: str = "activity", color: str = "blue") -> rx.Component:
-    """Create a statistic card component.
-    
-    Args:
-        title: Card title/label
-        value: Main value to display
-        icon_name: Lucide icon name
-        color: Color scheme (blue, green, red, orange, purple, indigo)
-        
-    Returns:
-        Reflex component for stat card
-    """
-    color_map = {
-        "blue": "blue",
-        "green": "green",
-        "red": "red",
-        "orange": "orange",
-        "purple": "purple",
-        "indigo": "indigo",
-    }
-    
-    accent_color = color_map.get(color, "blue")
-    
+
+@rx.memo
+def _stat_card(
+    title: rx.Var[str],
+    value: rx.Var[str],
+    icon_name: rx.Var[str],
+    color: rx.Var[str],
+) -> rx.Component:
+    """Memoized stat card body, re-rendered only when its props change."""
     return rx.box(
         rx.hstack(
             rx.center(
-                rx.icon(icon_name, size=24),
+                rx.match(
+                    icon_name,
+                    *[(name, rx.icon(tag, size=24)) for name, tag in _STAT_CARD_ICONS.items()],
+                    rx.icon("circle_help", size=24),
+                ),
                 width="3em",
                 height="3em",
                 border_radius="full",
-                bg=rx.color(accent_color, 3),
-                color=rx.color(accent_color, 11),
+                bg=rx.color(color, 3),
+                color=rx.color(color, 11),
             ),
             rx.vstack(
                 rx.text(title, font_size="0.875em", color="gray.500", font_weight="500"),
@@ -46,15 +50,64 @@ def stat_card(title: str, value: str, icon_name: str = "activity", color: str =
             align_items="center",
         ),
         padding="1.5em",
-        border_radius="12px",
-        background="white",
-        border="1px solid",
-        border_color="gray.100",
-        box_shadow="0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)",
-        _hover={
-            "transform": "translateY(-2px)",
-            "box_shadow": "0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06)",
-            "border_color": rx.color(accent_color, 5),
-        },
+        **CARD_STYLE,
+        _hover={**CARD_HOVER, "border_color": rx.color(color, 5)},
         transition="all 0.2s ease",
     )
+
+
+def stat_card(
+    title: Union[str, rx.Var[str]],
+    value: Union[str, rx.Var[str]],
+    icon_name: str = "activity",
+    color: Union[str, rx.Var[str]] = "blue",
+) -> rx.Component:
+    """Create a statistic card component.
+    
+    Args:
+        title: Card title/label
+        value: Main value to display
+        icon_name: Icon name, one of _STAT_CARD_ICONS
+        color: Radix color name (blue, green, red, orange, purple, indigo...); may be a state Var
+        
+    Returns:
+        Reflex component for stat card
+    """
+    return _stat_card(
+        title=title,
+        value=value,
+        icon_name=icon_name,
+        color=color,
+    )
+
+
+@rx.memo
+def _status_card(label: rx.Var[str], value: rx.Var[str], badge_color: rx.Var[str]) -> rx.Component:
+    """Memoized status card body, re-rendered only when its props change."""
+    return rx.box(
+        rx.vstack(
+            rx.text(label, font_weight="bold", color="gray.700"),
+            rx.cond(
+                badge_color != "",
+                rx.badge(value, color_scheme=badge_color, font_size="1.2em"),
+                rx.text(value, font_size="1.2em", color="gray.800"),
+            ),
+            spacing="2",
+        ),
+        padding="1.5em",
+        **CARD_STYLE,
+    )
+
+
+def status_card(label: str, value: str, badge_color: str = "") -> rx.Component:
+    """Create a system status card component.
+    
+    Args:
+        label: Card label
+        value: Value to display
+        badge_color: Badge color scheme; the value is shown as plain text if empty
+        
+    Returns:
+        Reflex component for status card
+    """
+    return _status_card(label=label, value=value, badge_color=badge_color)
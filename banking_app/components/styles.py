@@ -0,0 +1,25 @@
+"""Shared style constants."""
+
+CARD_SHADOW = "0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)"
+CARD_HOVER_SHADOW = "0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06)"
+
+# White rounded card with a light border and shadow
+CARD_STYLE = dict(
+    background="white",
+    border_radius="12px",
+    border="1px solid",
+    border_color="gray.100",
+    box_shadow=CARD_SHADOW,
+)
+
+# Lift effect applied to interactive cards on hover
+CARD_HOVER = {
+    "transform": "translateY(-2px)",
+    "box_shadow": CARD_HOVER_SHADOW,
+}
+
+# Card wrapping a data table or a form
+TABLE_CARD_STYLE = {**CARD_STYLE, "border_color": "gray.200"}
+
+# Bold caption above a form field
+LABEL_STYLE = dict(font_weight="bold", font_size="0.9em")
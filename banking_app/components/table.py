@@ -0,0 +1,29 @@
+"""Shared helpers for data tables."""
+
+import reflex as rx
+
+# Keeps column headers visible while the table body scrolls.
+STICKY_HEADER_STYLE = {
+    "position": "sticky",
+    "top": "0",
+    "z_index": "1",
+    "background": "white",
+}
+
+
+def fraud_badge(is_fraud: rx.Var[int], fraud_text: str = "Fraud", safe_text: str = "Safe") -> rx.Component:
+    """Create the fraud status badge of a table row.
+
+    Args:
+        is_fraud: Row fraud flag (1 for fraud)
+        fraud_text: Badge text for fraudulent rows
+        safe_text: Badge text for legitimate rows
+
+    Returns:
+        Badge switched on is_fraud
+    """
+    return rx.match(
+        is_fraud,
+        (1, rx.badge(fraud_text, color_scheme="red")),
+        rx.badge(safe_text, color_scheme="green"),
+    )
@@ -1,16 +1,89 @@
 """Pydantic models for the application."""
 
+import dataclasses
 import reflex as rx
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Union, get_args, get_origin
 
 
-class Transaction(rx.Base):
-    """Transaction model."""
+def _numeric_kind(annotation: Any) -> Optional[type]:
+    """Return int or float for (optional) numeric annotations, else None."""
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else None
+    return annotation if annotation in (int, float) else None
+
+
+def _to_number(value: Any, kind: type) -> Any:
+    """Convert a numeric field the API sent as another type (e.g. "12.50")."""
+    if value is None or type(value) is kind:
+        return value
+    if kind is int and isinstance(value, str):
+        # "3.0" is not accepted by int()
+        return int(float(value))
+    return kind(value)
+
+
+# Numeric fields per model class (name -> int or float), filled on first use
+_numeric_fields: Dict[type, Dict[str, type]] = {}
+
+
+class _ApiModel(rx.Base):
+    """Base for models built from API payloads.
+
+    Undeclared fields are dropped so they are not stored in state or sent to
+    the client.
+    """
+
+    class Config:
+        extra = "ignore"
+
+    @classmethod
+    def _coerce(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize values the API may send with another type than declared.
+
+        Construction skips pydantic's validation, so numbers sent as strings
+        are converted here before anything formats them.
+        """
+        if "id" in values and not isinstance(values["id"], str):
+            values["id"] = str(values["id"])
+        numeric = _numeric_fields.get(cls)
+        if numeric is None:
+            numeric = _numeric_fields[cls] = {
+                name: kind
+                for name, field in cls.__fields__.items()
+                if (kind := _numeric_kind(field.outer_type_)) is not None
+            }
+        for name, kind in numeric.items():
+            if name in values:
+                values[name] = _to_number(values[name], kind)
+        return values
+
+    @classmethod
+    def from_api(cls, item: Dict[str, Any]):
+        """Build a model from an API payload without running validation.
+
+        The payload comes from our own API, so the per-field validation of
+        the regular constructor is skipped; only declared fields are kept.
+        """
+        fields = cls.__fields__
+        return cls.construct(**cls._coerce({k: v for k, v in item.items() if k in fields}))
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Transaction:
+    """Transaction model.
+
+    Transactions only live in the server-side page cache (pages are sent to
+    the client as columns), so this is a slotted, frozen dataclass rather than
+    an rx.Base: cached rows take less memory and are safe to share between
+    sessions.
+    """
     id: str
     client_id: int
-    card_id: Optional[int] = None
     date: str
     amount: float
+    isFraud: int
+    card_id: Optional[int] = None
     use_chip: Optional[str] = None
     merchant_id: Optional[int] = None
     merchant_city: Optional[str] = None
@@ -18,26 +91,100 @@ class Transaction(rx.Base):
     zip: Optional[float] = None
     mcc: Optional[int] = None
     errors: Optional[str] = None
+    # Preformatted display values, filled in by from_api
+    amount_display: str = ""
+    amount_color: str = ""
+    fraud_label: str = ""
+    fraud_color: str = ""
+
+    @classmethod
+    def from_api(cls, item: Dict[str, Any]) -> "Transaction":
+        """Build a transaction from an API payload.
+
+        Formats the amount and resolves the badge colors once here, so rows
+        only display precomputed strings. Undeclared fields are dropped.
+        """
+        values = {k: v for k, v in item.items() if k in _TRANSACTION_FIELDS}
+        values["id"] = str(values["id"])
+        for name, kind in _TRANSACTION_NUMERIC_FIELDS.items():
+            if name in values:
+                values[name] = _to_number(values[name], kind)
+        amount = values["amount"]
+        values["amount_display"] = f"${amount:.2f}"
+        values["amount_color"] = "red.600" if amount < 0 else "green.600"
+        if values["isFraud"] == 1:
+            values["fraud_label"], values["fraud_color"] = "Fraud", "red"
+        else:
+            values["fraud_label"], values["fraud_color"] = "Safe", "green"
+        return cls(**values)
+
+
+_TRANSACTION_FIELDS = frozenset(f.name for f in dataclasses.fields(Transaction))
+_TRANSACTION_NUMERIC_FIELDS = {
+    f.name: kind for f in dataclasses.fields(Transaction) if (kind := _numeric_kind(f.type)) is not None
+}
+
+
+class RecentTransaction(_ApiModel):
+    """Transaction model limited to the fields shown on the dashboard."""
+    id: str
+    date: str
+    client_id: int
+    amount: float
+    use_chip: Optional[str] = None
     isFraud: int
 
 
-class Customer(rx.Base):
+def _average_amount(total_amount: float, transactions_count: int) -> float:
+    """Average transaction amount, 0 for a customer without transactions.
+
+    Computed per customer rather than vectorized: pages carry 10-50
+    customers, and the real fix is the API sending avg_amount itself.
+    """
+    return total_amount / transactions_count if transactions_count > 0 else 0.0
+
+
+class Customer(_ApiModel):
     """Customer model."""
     id: str
     transactions_count: int
     total_amount: float
     avg_amount: float = 0.0
     fraud_count: int = 0
+    # Preformatted display values, filled in by from_api
+    total_amount_str: str = ""
+    avg_amount_str: str = ""
+
+    @classmethod
+    def from_api(cls, item: Dict[str, Any]) -> "Customer":
+        """Build a customer from an API payload.
+
+        Computes avg_amount when the API omits it and formats the amounts
+        once here, so rows only display precomputed strings.
+        """
+        customer = super().from_api(item)
+        # Fallback for API versions that omit avg_amount (see
+        # test_customers_include_avg_amount); drop once all of them send it
+        if "avg_amount" not in item:
+            customer.avg_amount = _average_amount(customer.total_amount, customer.transactions_count)
+        customer.total_amount_str = f"${customer.total_amount:.2f}"
+        customer.avg_amount_str = f"${customer.avg_amount:.2f}"
+        return customer
+
+    @classmethod
+    def many_from_api(cls, items: List[Dict[str, Any]]) -> List["Customer"]:
+        """Build customers from a page of API payloads, skipping empty ones."""
+        return [cls.from_api(item) for item in items if item]
 
 
-class DataStats(rx.Base):
+class DataStats(_ApiModel):
     """Data statistics model."""
     total_transactions: int
     fraud_rate: float
     # Add other fields as needed for specific stats
 
 
-class FraudStat(rx.Base):
+class FraudStat(_ApiModel):
     """Fraud statistics model."""
     type: str
     total_count: int
@@ -45,7 +192,7 @@ class FraudStat(rx.Base):
     fraud_rate: float
 
 
-class DailyStat(rx.Base):
+class DailyStat(_ApiModel):
     """Daily statistics model."""
     step: str
     count: int
@@ -54,7 +201,7 @@ class DailyStat(rx.Base):
     avg_amount: float = 0.0
 
 
-class TypeStat(rx.Base):
+class TypeStat(_ApiModel):
     """Statistics by transaction type model."""
     type: str
     count: int
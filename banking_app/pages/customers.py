@@ -3,7 +3,52 @@
 import reflex as rx
 from ..components.layout import base_layout
 from ..components.stat_card import stat_card
+from ..components.styles import TABLE_CARD_STYLE
+from ..components.table import STICKY_HEADER_STYLE
 from ..state.app_state import AppState
+from ..models import Customer
+
+
+@rx.memo
+def _customer_row(customer: rx.Var[Customer]) -> rx.Component:
+    """Table row for a single customer, re-rendered only when its data changes."""
+    return rx.table.row(
+        rx.table.cell(
+            rx.hstack(
+                rx.icon("user", size=16),
+                rx.text(customer.id, font_weight="bold"),
+                spacing="2",
+                align_items="center",
+            )
+        ),
+        rx.table.cell(customer.transactions_count),
+        rx.table.cell(
+            rx.text(
+                customer.total_amount_str,
+                color="green.600",
+                font_weight="500",
+            )
+        ),
+        rx.table.cell(customer.avg_amount_str),
+        rx.table.cell(
+            rx.cond(
+                customer.fraud_count > 0,
+                rx.badge(
+                    customer.fraud_count.to(str),
+                    color_scheme="red",
+                ),
+                rx.text("0", color="gray.500"),
+            )
+        ),
+        rx.table.cell(
+            rx.button(
+                "View Profile",
+                on_click=AppState.load_customer_profile(customer.id),
+                size="1",
+                variant="soft",
+            )
+        ),
+    )
 
 
 def customers() -> rx.Component:
@@ -28,13 +73,13 @@ def customers() -> rx.Component:
                 ),
                 stat_card(
                     "Avg Transaction",
-                    f"${AppState.stats_overview.get('avg_amount', 0).to(float):,.2f}",
+                    AppState.avg_amount_str,
                     "credit-card",
                     "green",
                 ),
                 stat_card(
                     "Total Volume",
-                    f"${AppState.stats_overview.get('total_amount', 0).to(float):,.0f}",
+                    AppState.total_volume_str,
                     "dollar-sign",
                     "purple",
                 ),
@@ -46,11 +91,14 @@ def customers() -> rx.Component:
 
             # Search Bar
             rx.hstack(
-                rx.input(
-                    placeholder="Search by Customer ID...",
-                    value=AppState.search_customer_id,
-                    on_change=AppState.set_search_customer_id,
-                    width="300px",
+                rx.debounce_input(
+                    rx.input(
+                        placeholder="Search by Customer ID...",
+                        value=AppState.search_customer_id,
+                        on_change=AppState.set_search_customer_id,
+                        width="300px",
+                    ),
+                    debounce_timeout=300,
                 ),
                 rx.button(
                     rx.cond(
@@ -85,7 +133,7 @@ def customers() -> rx.Component:
                 AppState.customer_profile,
                 rx.vstack(
                     rx.heading(f"Customer Profile: {AppState.customer_profile['id']}", size="6"),
-                    rx.button("Close Profile", on_click=lambda: AppState.set_customer_profile(None), variant="outline"),
+                    rx.button("Close Profile", on_click=AppState.clear_customer_profile, variant="outline"),
                     # Add more profile details here if needed, or rely on a separate view/modal if implied
                     # For now, let's keep it simple and focus on the list table
                     rx.text("Profile loaded. (Implement detailed view here or navigate)", color="gray.500"),
@@ -98,7 +146,7 @@ def customers() -> rx.Component:
 
             # All Customers Table
             rx.cond(
-                ~AppState.is_loading & (AppState.customers.length() > 0),
+                AppState.show_customers_table,
                 rx.vstack(
                     rx.box(
                         rx.table.root(
@@ -111,65 +159,26 @@ def customers() -> rx.Component:
                                     rx.table.column_header_cell("Fraud Count"),
                                     rx.table.column_header_cell("Actions"),
                                 ),
+                                **STICKY_HEADER_STYLE,
                             ),
                             rx.table.body(
                                 rx.foreach(
                                     AppState.customers,
-                                    lambda customer: rx.table.row(
-                                        rx.table.cell(
-                                            rx.hstack(
-                                                rx.icon("user", size=16),
-                                                rx.text(customer.id, font_weight="bold"),
-                                                spacing="2",
-                                                align_items="center",
-                                            )
-                                        ),
-                                        rx.table.cell(customer.transactions_count),
-                                        rx.table.cell(
-                                            rx.text(
-                                                f"${customer.total_amount:.2f}",
-                                                color="green.600",
-                                                font_weight="500",
-                                            )
-                                        ),
-                                        rx.table.cell(f"${customer.avg_amount:.2f}"),
-                                        rx.table.cell(
-                                            rx.cond(
-                                                customer.fraud_count > 0,
-                                                rx.badge(
-                                                    customer.fraud_count.to(str),
-                                                    color_scheme="red",
-                                                ),
-                                                rx.text("0", color="gray.500"),
-                                            )
-                                        ),
-                                        rx.table.cell(
-                                            rx.button(
-                                                "View Profile",
-                                                on_click=lambda: AppState.load_customer_profile(customer.id.to(str)),
-                                                size="1",
-                                                variant="soft",
-                                            )
-                                        ),
-                                    ),
+                                    lambda customer: _customer_row(customer=customer, key=customer.id),
                                 ),
                             ),
                         ),
-                        background="white",
                         padding="0", # Remove padding to make table flush or keep small
-                        border_radius="12px",
-                        border="1px solid",
-                        border_color="gray.200",
-                        box_shadow="0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)",
-                        overflow_x="hidden", # Prevent double scrollbars
-                        overflow="hidden", 
+                        **TABLE_CARD_STYLE,
+                        max_height="70vh",
+                        overflow_y="auto",
                         width="100%",
                     ),
                     
                     # Pagination for customers
                     rx.hstack(
                         rx.text(
-                            f"Page {AppState.customers_page} | Total: {AppState.total_customers} customers",
+                            f"Page {AppState.customers_page} of {AppState.customers_total_pages} | Total: {AppState.total_customers} customers",
                             color="gray.600",
                         ),
                         rx.spacer(),
@@ -191,7 +200,7 @@ def customers() -> rx.Component:
                                     rx.text("Next"),
                                 ),
                                 on_click=AppState.next_customers_page,
-                                disabled=AppState.customers_page * AppState.items_per_page >= AppState.total_customers,
+                                disabled=AppState.customers_page >= AppState.customers_total_pages,
                                 variant="outline",
                             ),
                             spacing="2",
@@ -205,5 +214,5 @@ def customers() -> rx.Component:
                 ),
             ),
         ),
-        on_mount=[AppState.load_top_customers, AppState.load_customers],
+        on_mount=AppState.load_customers_page,
     )
@@ -2,8 +2,10 @@
 
 import reflex as rx
 from ..components.layout import base_layout
-from ..components.stat_card import stat_card
-from ..state.app_state import AppState
+from ..components.stat_card import stat_card, status_card
+from ..components.styles import CARD_STYLE
+from ..components.table import fraud_badge
+from ..state.app_state import AppState, RECENT_WATCH_HEARTBEAT_SECONDS
 
 
 def dashboard() -> rx.Component:
@@ -40,31 +42,31 @@ def dashboard() -> rx.Component:
             
             # Statistics cards
             rx.cond(
-                ~AppState.is_loading & (AppState.stats_overview != {}),
+                AppState.show_stats,
                 rx.vstack(
                     rx.heading("Statistics Overview", size="6", margin_bottom="1em"),
                     rx.grid(
                         stat_card(
                             "Total Transactions",
-                            AppState.stats_overview.get("total_transactions", 0).to(str),
+                            AppState.total_transactions_str,
                             "credit-card",
                             "blue",
                         ),
                         stat_card(
                             "Total Amount",
-                            f"${AppState.stats_overview.get('total_amount', 0).to(float):,.2f}",
+                            AppState.total_amount_str,
                             "dollar-sign",
                             "green",
                         ),
                         stat_card(
                             "Fraud Rate",
-                            f"{(AppState.stats_overview.get('fraud_rate', 0).to(float) * 100):.2f}%",
+                            AppState.fraud_rate_pct_str,
                             "alert-triangle",
                             "red",
                         ),
                         stat_card(
                             "Average Amount",
-                            f"${AppState.stats_overview.get('avg_amount', 0).to(float):,.2f}",
+                            AppState.avg_amount_str,
                             "bar-chart-2",
                             "purple",
                         ),
@@ -79,7 +81,7 @@ def dashboard() -> rx.Component:
             
             # Recent transactions
             rx.cond(
-                ~AppState.is_loading & (AppState.recent_transactions.length() > 0),
+                AppState.show_recent,
                 rx.vstack(
                     rx.heading("Recent Transactions", size="6", margin_bottom="1em"),
                     rx.box(
@@ -104,22 +106,14 @@ def dashboard() -> rx.Component:
                                         rx.table.cell(f"${txn.amount:.2f}"),
                                         rx.table.cell(txn.use_chip),
                                         rx.table.cell(
-                                            rx.cond(
-                                                txn.isFraud == 1,
-                                                rx.badge("Yes", color_scheme="red"),
-                                                rx.badge("No", color_scheme="green"),
-                                            )
+                                            fraud_badge(txn.isFraud, "Yes", "No")
                                         ),
                                     ),
                                 ),
                             ),
                         ),
-                        background="white",
                         padding="1.5em",
-                        border_radius="12px",
-                        border="1px solid",
-                        border_color="gray.100",
-                        box_shadow="0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)",
+                        **CARD_STYLE,
                     ),
                     width="100%",
                     margin_bottom="2em",
@@ -128,61 +122,20 @@ def dashboard() -> rx.Component:
             
             # System status
             rx.cond(
-                ~AppState.is_loading & (AppState.system_health != {}),
+                AppState.show_system_status,
                 rx.vstack(
                     rx.heading("System Status", size="6", margin_bottom="1em"),
                     rx.grid(
-                        rx.box(
-                            rx.vstack(
-                                rx.text("API Health", font_weight="bold", color="gray.700"),
-                                rx.badge(
-                                    AppState.system_health.get("status", "unknown"),
-                                    color_scheme="green",
-                                    font_size="1.2em",
-                                ),
-                                spacing="2",
-                            ),
-                            padding="1.5em",
-                            background="white",
-                            border_radius="12px",
-                            border="1px solid",
-                            border_color="gray.100",
-                            box_shadow="0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)",
+                        status_card(
+                            "API Health",
+                            AppState.system_health.get("status", "unknown").to(str),
+                            badge_color="green",
                         ),
-                        rx.box(
-                            rx.vstack(
-                                rx.text("API Version", font_weight="bold", color="gray.700"),
-                                rx.text(
-                                    AppState.system_metadata.get("version", "1.0.0"),
-                                    font_size="1.2em",
-                                    color="gray.800",
-                                ),
-                                spacing="2",
-                            ),
-                            padding="1.5em",
-                            background="white",
-                            border_radius="12px",
-                            border="1px solid",
-                            border_color="gray.100",
-                            box_shadow="0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)",
-                        ),
-                        rx.box(
-                            rx.vstack(
-                                rx.text("Total Endpoints", font_weight="bold", color="gray.700"),
-                                rx.text(
-                                    "20",
-                                    font_size="1.2em",
-                                    color="gray.800",
-                                ),
-                                spacing="2",
-                            ),
-                            padding="1.5em",
-                            background="white",
-                            border_radius="12px",
-                            border="1px solid",
-                            border_color="gray.100",
-                            box_shadow="0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)",
+                        status_card(
+                            "API Version",
+                            AppState.system_metadata.get("version", "1.0.0").to(str),
                         ),
+                        status_card("Total Endpoints", "20"),
                         columns="3",
                         spacing="4",
                         width="100%",
@@ -190,9 +143,17 @@ def dashboard() -> rx.Component:
                     width="100%",
                 ),
             ),
+
+            # Heartbeat keeping the recent transactions watcher alive
+            rx.moment(
+                interval=RECENT_WATCH_HEARTBEAT_SECONDS * 1000,
+                on_change=AppState.keep_watching_recent_transactions,
+                display="none",
+            ),
             
             width="100%",
             spacing="4",
         ),
-        on_mount=AppState.load_dashboard_data,
+        on_mount=[AppState.load_dashboard_data, AppState.watch_recent_transactions],
+        on_unmount=AppState.stop_watching_recent_transactions,
     )
@@ -1,9 +1,17 @@
 """Fraud detection page."""
 
 import reflex as rx
+from typing import Any, Dict
 from ..components.layout import base_layout
+from ..components.styles import TABLE_CARD_STYLE, LABEL_STYLE
 from ..components.stat_card import stat_card
-from ..state.app_state import AppState
+from ..components.in_view import in_view
+from ..state.app_state import AppState, FraudDataState, LookupState, US_STATES, COMMON_MCC_CODES
+
+# Dropdown options: static defaults baked into the page, plus any extra
+# values seen in the data
+_MERCHANT_STATE_OPTIONS = rx.Var.create(US_STATES) + LookupState.extra_merchant_states
+_MCC_OPTIONS = rx.Var.create(COMMON_MCC_CODES) + LookupState.extra_mcc_codes
 
 
 class FraudState(rx.State):
@@ -20,15 +28,18 @@ class FraudState(rx.State):
 
     def set_pred_use_chip(self, value: str):
         """Set prediction transaction type."""
-        self.pred_use_chip = value
+        if value != self.pred_use_chip:
+            self.pred_use_chip = value
 
     def set_pred_merchant_state(self, value: str):
         """Set prediction merchant state."""
-        self.pred_merchant_state = value
+        if value != self.pred_merchant_state:
+            self.pred_merchant_state = value
 
     def set_pred_mcc(self, value: str):
         """Set prediction MCC."""
-        self.pred_mcc = value
+        if value != self.pred_mcc:
+            self.pred_mcc = value
 
     def clear_form(self):
         """Clear all form fields."""
@@ -37,39 +48,40 @@ class FraudState(rx.State):
         self.pred_merchant_state = ""
         self.pred_mcc = ""
 
-    async def submit_prediction(self):
-        """Submit fraud prediction with proper async handling."""
-        # Validate inputs
-        if not self.pred_amount:
-            app_state = await self.get_state(AppState)
-            app_state.error_message = "Please enter an amount"
-            return
-
-        if not self.pred_mcc:
-            app_state = await self.get_state(AppState)
-            app_state.error_message = "Please enter a MCC code"
-            return
+    async def submit_prediction(self, force_refresh: bool = False):
+        """Submit fraud prediction with proper async handling.
 
-        if not self.pred_merchant_state:
-            app_state = await self.get_state(AppState)
-            app_state.error_message = "Please enter a merchant state"
-            return
+        Args:
+            force_refresh: Bypass cached predictions for identical inputs
+        """
+        fraud_state = await self.get_state(FraudDataState)
 
+        # Presence and format are checked by the browser; this only guards
+        # submissions that bypass the form (e.g. Force Refresh)
         try:
             amount = float(self.pred_amount)
             mcc = int(self.pred_mcc)
-
-            # Get AppState and call predict_fraud
-            app_state = await self.get_state(AppState)
-            await app_state.predict_fraud(
-                amount=amount,
-                use_chip=self.pred_use_chip,
-                merchant_state=self.pred_merchant_state,
-                mcc=mcc,
-            )
+            if not self.pred_merchant_state:
+                raise ValueError("missing merchant state")
         except ValueError:
-            app_state = await self.get_state(AppState)
-            app_state.error_message = "Invalid input: Amount must be a number and MCC must be an integer"
+            fraud_state.error_message = "Invalid input: Amount must be a number, MCC an integer and a merchant state is required"
+            return
+
+        await fraud_state.predict_fraud(
+            amount=amount,
+            use_chip=self.pred_use_chip,
+            merchant_state=self.pred_merchant_state,
+            mcc=mcc,
+            force_refresh=force_refresh,
+        )
+
+    async def handle_submit(self, form_data: Dict[str, Any]):
+        """Submit the prediction once the browser has validated the form."""
+        await self.submit_prediction()
+
+    async def refresh_prediction(self):
+        """Re-run the prediction against the backend, ignoring the cache."""
+        await self.submit_prediction(force_refresh=True)
 
 
 def fraud() -> rx.Component:
@@ -111,25 +123,25 @@ def fraud() -> rx.Component:
 
             # Fraud summary stats
             rx.cond(
-                ~AppState.is_loading & (AppState.fraud_summary != {}),
+                ~AppState.is_loading & (FraudDataState.fraud_summary != {}),
                 rx.vstack(
                     rx.heading("Fraud Summary", size="6", margin_bottom="1em"),
                     rx.grid(
                         stat_card(
                             "Total Frauds",
-                            AppState.fraud_summary.get("total_frauds", 0).to(str),
+                            FraudDataState.total_frauds_str,
                             "alert-octagon",
                             "red",
                         ),
                         stat_card(
                             "Fraud Rate",
-                            f"{(AppState.fraud_summary.get('fraud_rate', 0).to(float) * 100):.2f}%",
+                            FraudDataState.fraud_summary_rate_str,
                             "activity",
                             "orange",
                         ),
                         stat_card(
                             "Total Fraud Amount",
-                            f"${AppState.fraud_summary.get('total_fraud_amount', 0).to(float):,.2f}",
+                            FraudDataState.total_fraud_amount_str,
                             "dollar-sign",
                             "purple",
                         ),
@@ -142,64 +154,74 @@ def fraud() -> rx.Component:
                 ),
             ),
 
-            # Fraud by type
-            rx.cond(
-                ~AppState.is_loading & (AppState.fraud_by_type.length() > 0),
-                rx.vstack(
-                    rx.heading("Fraud by Transaction Type", size="6", margin_bottom="1em"),
-                    rx.box(
-                        rx.table.root(
-                            rx.table.header(
-                                rx.table.row(
-                                    rx.table.column_header_cell("Transaction Type"),
-                                    rx.table.column_header_cell("Total Transactions"),
-                                    rx.table.column_header_cell("Fraud Count"),
-                                    rx.table.column_header_cell("Fraud Rate"),
+            # Fraud by type (fetched once the section scrolls into view)
+            in_view(
+                rx.cond(
+                    FraudDataState.fraud_by_type_loading,
+                    rx.center(
+                        rx.spinner(size="3"),
+                        padding="2em",
+                    ),
+                ),
+                rx.cond(
+                    FraudDataState.fraud_by_type.length() > 0,
+                    rx.vstack(
+                        rx.heading("Fraud by Transaction Type", size="6", margin_bottom="1em"),
+                        rx.box(
+                            rx.table.root(
+                                rx.table.header(
+                                    rx.table.row(
+                                        rx.table.column_header_cell("Transaction Type"),
+                                        rx.table.column_header_cell("Total Transactions"),
+                                        rx.table.column_header_cell("Fraud Count"),
+                                        rx.table.column_header_cell("Fraud Rate"),
+                                    ),
                                 ),
-                            ),
-                            rx.table.body(
-                                rx.foreach(
-                                    AppState.fraud_by_type,
-                                    lambda item: rx.table.row(
-                                        rx.table.cell(
-                                            rx.badge(
-                                                item.type,
-                                                color_scheme="blue",
-                                                variant="soft",
-                                            )
-                                        ),
-                                        rx.table.cell(item.total_count),
-                                        rx.table.cell(
-                                            rx.text(
-                                                item.fraud_count.to(str),
-                                                font_weight="bold",
-                                                color="red.600",
-                                            )
-                                        ),
-                                        rx.table.cell(
-                                            rx.badge(
-                                                f"{(item.fraud_rate * 100):.2f}%",
-                                                color_scheme=rx.cond(
-                                                    item.fraud_rate > 0.05,
-                                                    "red",
-                                                    "green",
-                                                ),
-                                            )
+                                rx.table.body(
+                                    rx.foreach(
+                                        FraudDataState.fraud_by_type,
+                                        lambda item: rx.table.row(
+                                            rx.table.cell(
+                                                rx.badge(
+                                                    item.type,
+                                                    color_scheme="blue",
+                                                    variant="soft",
+                                                )
+                                            ),
+                                            rx.table.cell(item.total_count),
+                                            rx.table.cell(
+                                                rx.text(
+                                                    item.fraud_count.to(str),
+                                                    font_weight="bold",
+                                                    color="red.600",
+                                                )
+                                            ),
+                                            rx.table.cell(
+                                                rx.badge(
+                                                    f"{(item.fraud_rate * 100):.2f}%",
+                                                    color_scheme=rx.cond(
+                                                        item.fraud_rate > 0.05,
+                                                        "red",
+                                                        "green",
+                                                    ),
+                                                )
+                                            ),
                                         ),
                                     ),
                                 ),
                             ),
+                            padding="1.5em",
+                            **TABLE_CARD_STYLE,
                         ),
-                        background="white",
-                        padding="1.5em",
-                        border_radius="12px",
-                        border="1px solid",
-                        border_color="gray.200",
-                        box_shadow="0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)",
+                        width="100%",
+                        margin_bottom="2em",
                     ),
-                    width="100%",
-                    margin_bottom="2em",
                 ),
+                on_change=FraudDataState.load_fraud_by_type,
+                trigger_once=True,
+                root_margin="200px",
+                width="100%",
+                min_height="1px",
             ),
 
             # Fraud prediction form
@@ -213,79 +235,100 @@ def fraud() -> rx.Component:
                             margin_bottom="1em",
                         ),
 
-                        rx.grid(
-                            rx.vstack(
-                                rx.text("Amount", font_weight="bold", font_size="0.9em"),
-                                rx.input(
-                                    placeholder="100.00",
-                                    type="number",
-                                    value=FraudState.pred_amount,
-                                    on_change=FraudState.set_pred_amount,
+                        rx.el.form(
+                            rx.grid(
+                                rx.vstack(
+                                    rx.text("Amount", **LABEL_STYLE),
+                                    rx.input(
+                                        name="amount",
+                                        placeholder="100.00",
+                                        type="number",
+                                        step="0.01",
+                                        required=True,
+                                        value=FraudState.pred_amount,
+                                        on_change=FraudState.set_pred_amount,
+                                    ),
+                                    align_items="flex-start",
+                                    spacing="1",
                                 ),
-                                align_items="flex-start",
-                                spacing="1",
-                            ),
-                            rx.vstack(
-                                rx.text("Transaction Type", font_weight="bold", font_size="0.9em"),
-                                rx.select(
-                                    ["Swipe Transaction", "Chip Transaction", "Online Transaction"],
-                                    value=FraudState.pred_use_chip,
-                                    on_change=FraudState.set_pred_use_chip,
+                                rx.vstack(
+                                    rx.text("Transaction Type", **LABEL_STYLE),
+                                    rx.select(
+                                        ["Swipe Transaction", "Chip Transaction", "Online Transaction"],
+                                        value=FraudState.pred_use_chip,
+                                        on_change=FraudState.set_pred_use_chip,
+                                    ),
+                                    align_items="flex-start",
+                                    spacing="1",
                                 ),
-                                align_items="flex-start",
-                                spacing="1",
-                            ),
-                            rx.vstack(
-                                rx.text("Merchant State", font_weight="bold", font_size="0.9em"),
-                                rx.select(
-                                    AppState.merchant_states,
-                                    placeholder="Select State",
-                                    value=FraudState.pred_merchant_state,
-                                    on_change=FraudState.set_pred_merchant_state,
+                                rx.vstack(
+                                    rx.text("Merchant State", **LABEL_STYLE),
+                                    rx.select(
+                                        _MERCHANT_STATE_OPTIONS,
+                                        name="merchant_state",
+                                        required=True,
+                                        placeholder="Select State",
+                                        value=FraudState.pred_merchant_state,
+                                        on_change=FraudState.set_pred_merchant_state,
+                                    ),
+                                    align_items="flex-start",
+                                    spacing="1",
                                 ),
-                                align_items="flex-start",
-                                spacing="1",
-                            ),
-                            rx.vstack(
-                                rx.text("MCC (Merchant Category Code)", font_weight="bold", font_size="0.9em"),
-                                rx.select(
-                                    AppState.mcc_codes,
-                                    placeholder="Select MCC",
-                                    value=FraudState.pred_mcc,
-                                    on_change=FraudState.set_pred_mcc,
+                                rx.vstack(
+                                    rx.text("MCC (Merchant Category Code)", **LABEL_STYLE),
+                                    rx.select(
+                                        _MCC_OPTIONS,
+                                        name="mcc",
+                                        required=True,
+                                        placeholder="Select MCC",
+                                        value=FraudState.pred_mcc,
+                                        on_change=FraudState.set_pred_mcc,
+                                    ),
+                                    align_items="flex-start",
+                                    spacing="1",
                                 ),
-                                align_items="flex-start",
-                                spacing="1",
+                                columns="4",
+                                spacing="4",
+                                width="100%",
+                                margin_bottom="1em",
                             ),
-                            columns="4",
-                            spacing="4",
-                            width="100%",
-                        ),
 
-                        rx.hstack(
-                            rx.button(
-                                rx.cond(
-                                    AppState.is_loading,
-                                    rx.spinner(size="1", color="white"),
-                                    rx.text("Analyze Transaction"),
+                            rx.hstack(
+                                rx.button(
+                                    rx.cond(
+                                        AppState.is_loading,
+                                        rx.spinner(size="1", color="white"),
+                                        rx.text("Analyze Transaction"),
+                                    ),
+                                    type="submit",
+                                    color_scheme="purple",
+                                    size="3",
+                                    width="200px",
                                 ),
-                                on_click=FraudState.submit_prediction,
-                                color_scheme="purple",
-                                size="3",
-                                width="200px",
-                            ),
-                            rx.button(
-                                "Clear",
-                                on_click=FraudState.clear_form,
-                                variant="outline",
-                                size="3",
+                                rx.button(
+                                    "Force Refresh",
+                                    type="button",
+                                    on_click=FraudState.refresh_prediction,
+                                    variant="soft",
+                                    color_scheme="purple",
+                                    size="3",
+                                ),
+                                rx.button(
+                                    "Clear",
+                                    type="button",
+                                    on_click=FraudState.clear_form,
+                                    variant="outline",
+                                    size="3",
+                                ),
+                                spacing="3",
                             ),
-                            spacing="3",
+                            on_submit=FraudState.handle_submit,
+                            width="100%",
                         ),
 
                         # Prediction result
                         rx.cond(
-                            AppState.fraud_prediction != {},
+                            FraudDataState.fraud_prediction != {},
                             rx.box(
                                 rx.vstack(
                                     rx.heading("Prediction Result", size="5", margin_bottom="1em"),
@@ -293,7 +336,7 @@ def fraud() -> rx.Component:
                                         rx.vstack(
                                             rx.text("Fraud Classification", font_weight="bold"),
                                             rx.cond(
-                                                AppState.fraud_prediction.get("isFraud", False),
+                                                FraudDataState.is_fraud_prediction,
                                                 rx.badge("FRAUDULENT", color_scheme="red", font_size="1.5em"),
                                                 rx.badge("LEGITIMATE", color_scheme="green", font_size="1.5em"),
                                             ),
@@ -304,11 +347,11 @@ def fraud() -> rx.Component:
                                         rx.vstack(
                                             rx.text("Fraud Probability", font_weight="bold"),
                                             rx.text(
-                                                f"{(AppState.fraud_prediction.get('probability', 0).to(float) * 100):.1f}%",
+                                                FraudDataState.fraud_probability_pct,
                                                 font_size="2em",
                                                 font_weight="bold",
                                                 color=rx.cond(
-                                                    AppState.fraud_prediction.get("probability", 0).to(float) > 0.5,
+                                                    FraudDataState.is_high_fraud_probability,
                                                     "red.600",
                                                     "green.600",
                                                 ),
@@ -326,7 +369,7 @@ def fraud() -> rx.Component:
                                 border_radius="8px",
                                 border="2px solid",
                                 border_color=rx.cond(
-                                    AppState.fraud_prediction.get("isFraud", False),
+                                    FraudDataState.is_fraud_prediction,
                                     "red.300",
                                     "green.300",
                                 ),
@@ -337,11 +380,7 @@ def fraud() -> rx.Component:
                         spacing="4",
                     ),
                     padding="1.5em",
-                    background="white",
-                    border_radius="12px",
-                    border="1px solid",
-                    border_color="gray.200",
-                    box_shadow="0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)",
+                    **TABLE_CARD_STYLE,
                 ),
                 width="100%",
             ),
@@ -349,5 +388,5 @@ def fraud() -> rx.Component:
             width="100%",
             spacing="4",
         ),
-        on_mount=AppState.load_fraud_data,
+        on_mount=[FraudDataState.load_fraud_summary, LookupState.load_lookups],
     )
@@ -2,7 +2,82 @@
 
 import reflex as rx
 from ..components.layout import base_layout
-from ..state.app_state import AppState
+from ..components.styles import TABLE_CARD_STYLE, LABEL_STYLE
+from ..components.table import STICKY_HEADER_STYLE
+from ..state.app_state import AppState, TransactionsState
+
+# Type filter options: "All" followed by the types known to the API
+_USE_CHIP_OPTIONS = rx.Var.create(["All"]) + TransactionsState.transaction_types
+
+
+@rx.memo
+def _txn_row(
+    txn_id: rx.Var[str],
+    date: rx.Var[str],
+    client_id: rx.Var[int],
+    amount: rx.Var[str],
+    amount_color: rx.Var[str],
+    use_chip: rx.Var[str],
+    merchant_city: rx.Var[str],
+    merchant_state: rx.Var[str],
+    fraud_label: rx.Var[str],
+    fraud_color: rx.Var[str],
+) -> rx.Component:
+    """Table row for a single transaction, re-rendered only when its data changes."""
+    return rx.table.row(
+        rx.table.cell(
+            rx.text(
+                txn_id[:8] + "...",
+                font_size="0.85em",
+                color="gray.600",
+            )
+        ),
+        rx.table.cell(date),
+        rx.table.cell(client_id),
+        rx.table.cell(
+            rx.text(
+                amount,
+                font_weight="bold",
+                color=amount_color,
+            )
+        ),
+        rx.table.cell(
+            rx.badge(
+                use_chip,
+                color_scheme="blue",
+                variant="soft",
+            )
+        ),
+        rx.table.cell(
+            rx.text(
+                merchant_city,
+                font_size="0.85em",
+            )
+        ),
+        rx.table.cell(
+            merchant_state
+        ),
+        rx.table.cell(
+            rx.badge(fraud_label, color_scheme=fraud_color)
+        ),
+    )
+
+
+def _txn_row_at(i: rx.Var[int]) -> rx.Component:
+    """Build the row for index i of the columnar transactions state."""
+    return _txn_row(
+        txn_id=TransactionsState.txn_ids[i],
+        date=TransactionsState.txn_dates[i],
+        client_id=TransactionsState.txn_client_ids[i],
+        amount=TransactionsState.txn_amounts[i],
+        amount_color=TransactionsState.txn_amount_colors[i],
+        use_chip=TransactionsState.txn_use_chips[i],
+        merchant_city=TransactionsState.txn_merchant_cities[i],
+        merchant_state=TransactionsState.txn_merchant_states[i],
+        fraud_label=TransactionsState.txn_fraud_labels[i],
+        fraud_color=TransactionsState.txn_fraud_colors[i],
+        key=TransactionsState.txn_ids[i],
+    )
 
 
 def transactions() -> rx.Component:
@@ -34,54 +109,63 @@ def transactions() -> rx.Component:
                     rx.heading("Filters", size="5", margin_bottom="1em"),
                     rx.grid(
                         rx.vstack(
-                            rx.text("Transaction Type", font_weight="bold", font_size="0.9em"),
+                            rx.text("Transaction Type", **LABEL_STYLE),
                             rx.select(
-                                ["All", "Swipe Transaction", "Chip Transaction", "Online Transaction"],
+                                _USE_CHIP_OPTIONS,
                                 placeholder="Select type",
-                                value=AppState.filter_use_chip,
-                                on_change=AppState.set_filter_use_chip,
+                                value=TransactionsState.filter_use_chip,
+                                on_change=TransactionsState.set_filter_use_chip,
                             ),
                             align_items="flex-start",
                             spacing="1",
                         ),
                         rx.vstack(
-                            rx.text("Fraud Status", font_weight="bold", font_size="0.9em"),
+                            rx.text("Fraud Status", **LABEL_STYLE),
                             rx.select(
                                 ["All", "Fraudulent", "Legitimate"],
                                 placeholder="Select status",
-                                on_change=AppState.set_filter_is_fraud,
+                                on_change=TransactionsState.set_filter_is_fraud,
                             ),
                             align_items="flex-start",
                             spacing="1",
                         ),
                         rx.vstack(
-                            rx.text("Min Amount", font_weight="bold", font_size="0.9em"),
-                            rx.input(
-                                placeholder="0.00",
-                                type="number",
-                                value=AppState.filter_min_amount,
-                                on_change=AppState.set_filter_min_amount,
+                            rx.text("Min Amount", **LABEL_STYLE),
+                            rx.debounce_input(
+                                rx.input(
+                                    placeholder="0.00",
+                                    type="number",
+                                    value=TransactionsState.filter_min_amount,
+                                    on_change=TransactionsState.set_filter_min_amount,
+                                ),
+                                debounce_timeout=300,
                             ),
                             align_items="flex-start",
                             spacing="1",
                         ),
                         rx.vstack(
-                            rx.text("Max Amount", font_weight="bold", font_size="0.9em"),
-                            rx.input(
-                                placeholder="10000.00",
-                                type="number",
-                                value=AppState.filter_max_amount,
-                                on_change=AppState.set_filter_max_amount,
+                            rx.text("Max Amount", **LABEL_STYLE),
+                            rx.debounce_input(
+                                rx.input(
+                                    placeholder="10000.00",
+                                    type="number",
+                                    value=TransactionsState.filter_max_amount,
+                                    on_change=TransactionsState.set_filter_max_amount,
+                                ),
+                                debounce_timeout=300,
                             ),
                             align_items="flex-start",
                             spacing="1",
                         ),
                         rx.vstack(
-                            rx.text("Merchant State", font_weight="bold", font_size="0.9em"),
-                            rx.input(
-                                placeholder="e.g., CA",
-                                value=AppState.filter_merchant_state,
-                                on_change=AppState.set_filter_merchant_state,
+                            rx.text("Merchant State", **LABEL_STYLE),
+                            rx.debounce_input(
+                                rx.input(
+                                    placeholder="e.g., CA",
+                                    value=TransactionsState.filter_merchant_state,
+                                    on_change=TransactionsState.set_filter_merchant_state,
+                                ),
+                                debounce_timeout=300,
                             ),
                             align_items="flex-start",
                             spacing="1",
@@ -93,12 +177,12 @@ def transactions() -> rx.Component:
                     rx.hstack(
                         rx.button(
                             "Apply Filters",
-                            on_click=AppState.load_transactions,
+                            on_click=TransactionsState.load_transactions,
                             color_scheme="blue",
                         ),
                         rx.button(
                             "Reset",
-                            on_click=[AppState.reset_filters, AppState.load_transactions],
+                            on_click=TransactionsState.reset_and_reload,
                             variant="outline",
                         ),
                         spacing="2",
@@ -106,11 +190,7 @@ def transactions() -> rx.Component:
                     spacing="3",
                 ),
                 padding="1.5em",
-                background="white",
-                border_radius="12px",
-                border="1px solid",
-                border_color="gray.200",
-                box_shadow="0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)",
+                **TABLE_CARD_STYLE,
                 margin_bottom="2em",
             ),
             
@@ -125,7 +205,7 @@ def transactions() -> rx.Component:
             
             # Transactions table
             rx.cond(
-                ~AppState.is_loading & (AppState.transactions.length() > 0),
+                ~AppState.is_loading & (TransactionsState.txn_ids.length() > 0),
                 rx.vstack(
                     rx.box(
                         rx.table.root(
@@ -140,71 +220,28 @@ def transactions() -> rx.Component:
                                     rx.table.column_header_cell("State"),
                                     rx.table.column_header_cell("Fraud"),
                                 ),
+                                **STICKY_HEADER_STYLE,
                             ),
+                            # Rows are not windowed: a page holds at most
+                            # MAX_ITEMS_PER_PAGE rows, and a scroll handler
+                            # would cost an event round trip per scroll step
                             rx.table.body(
                                 rx.foreach(
-                                    AppState.transactions,
-                                    lambda txn: rx.table.row(
-                                        rx.table.cell(
-                                            rx.text(
-                                                txn.id[:8] + "...",
-                                                font_size="0.85em",
-                                                color="gray.600",
-                                            )
-                                        ),
-                                        rx.table.cell(txn.date),
-                                        rx.table.cell(txn.client_id),
-                                        rx.table.cell(
-                                            rx.text(
-                                                f"${txn.amount:.2f}",
-                                                font_weight="bold",
-                                                color=rx.cond(
-                                                    txn.amount < 0,
-                                                    "red.600",
-                                                    "green.600",
-                                                ),
-                                            )
-                                        ),
-                                        rx.table.cell(
-                                            rx.badge(
-                                                txn.use_chip,
-                                                color_scheme="blue",
-                                                variant="soft",
-                                            )
-                                        ),
-                                        rx.table.cell(
-                                            rx.text(
-                                                txn.merchant_city,
-                                                font_size="0.85em",
-                                            )
-                                        ),
-                                        rx.table.cell(
-                                            txn.merchant_state
-                                        ),
-                                        rx.table.cell(
-                                            rx.cond(
-                                                txn.isFraud == 1,
-                                                rx.badge("Fraud", color_scheme="red"),
-                                                rx.badge("Safe", color_scheme="green"),
-                                            )
-                                        ),
-                                    ),
+                                    rx.Var.range(TransactionsState.txn_ids.length()),
+                                    _txn_row_at,
                                 ),
                             ),
                         ),
-                        background="white",
                         padding="1.5em",
-                        border_radius="12px",
-                        border="1px solid",
-                        border_color="gray.200",
-                        box_shadow="0 1px 3px 0 rgba(0, 0, 0, 0.1), 0 1px 2px 0 rgba(0, 0, 0, 0.06)",
-                        overflow_x="auto",
+                        **TABLE_CARD_STYLE,
+                        max_height="70vh",
+                        overflow="auto",
                     ),
                     
                     # Pagination
                     rx.hstack(
                         rx.text(
-                            f"Page {AppState.current_page} | Total: {AppState.total_transactions} transactions",
+                            TransactionsState.page_label,
                             color="gray.600",
                         ),
                         rx.spacer(),
@@ -215,8 +252,8 @@ def transactions() -> rx.Component:
                                     rx.spinner(size="1", color="gray"),
                                     rx.text("Previous"),
                                 ),
-                                on_click=AppState.prev_page,
-                                disabled=AppState.current_page == 1,
+                                on_click=TransactionsState.prev_page,
+                                disabled=~TransactionsState.has_prev_page,
                                 variant="outline",
                             ),
                             rx.button(
@@ -225,8 +262,8 @@ def transactions() -> rx.Component:
                                     rx.spinner(size="1", color="gray"),
                                     rx.text("Next"),
                                 ),
-                                on_click=AppState.next_page,
-                                disabled=AppState.current_page * AppState.items_per_page >= AppState.total_transactions,
+                                on_click=TransactionsState.next_page,
+                                disabled=~TransactionsState.has_next_page,
                                 variant="outline",
                             ),
                             spacing="2",
@@ -242,7 +279,7 @@ def transactions() -> rx.Component:
             
             # Empty state
             rx.cond(
-                ~AppState.is_loading & (AppState.transactions.length() == 0),
+                ~AppState.is_loading & (TransactionsState.txn_ids.length() == 0),
                 rx.center(
                     rx.vstack(
                         rx.icon("file-text", size=64, color="gray"),
@@ -257,5 +294,5 @@ def transactions() -> rx.Component:
             width="100%",
             spacing="4",
         ),
-        on_mount=AppState.load_transactions,
+        on_mount=TransactionsState.load_transactions_page,
     )
@@ -1,7 +1,50 @@
 """API Client for Banking Transactions API."""
 
+import asyncio
+import time
 import httpx
-from typing import Optional, Dict, Any, List
+import orjson
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator
+from urllib.parse import urlencode
+
+try:
+    import h2  # noqa: F401  (installed by the httpx[http2] extra)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Connection pool bounds for the shared client
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+# The event stream gets its own connection, so it never holds one of the pool's
+STREAM_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=0, max_connections=1)
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Default lifetime of cached responses for read-mostly endpoints (in seconds)
+RESPONSE_CACHE_TTL_SECONDS = 60
+
+# Bodies larger than this are decoded in a worker thread (in bytes)
+LARGE_RESPONSE_BYTES = 1024 * 1024
+
+# Customer profile LRU: size, lifetime of profiles and of failed lookups
+PROFILE_CACHE_SIZE = 1024
+PROFILE_CACHE_TTL_SECONDS = 60
+PROFILE_FAILURE_TTL_SECONDS = 5
+
+# Status codes meaning an optional endpoint (bulk customers, dashboard
+# aggregate, event stream) is not available: FastAPI answers 405 when the
+# path matches GET /api/customers/{customer_id} only
+_BULK_UNSUPPORTED_STATUS = (404, 405)
+# Endpoints whose responses are part of the dashboard aggregate: field -> endpoint
+_DASHBOARD_AGGREGATE_PARTS = {
+    "stats_overview": "/api/stats/overview",
+    "health": "/api/system/health",
+    "metadata": "/api/system/metadata",
+}
+# Concurrent requests per call when profiles are fetched one by one
+PROFILE_FETCH_CONCURRENCY = 8
+# An event stream with no event for this long is treated as dropped
+STREAM_IDLE_TIMEOUT_SECONDS = 300
 
 
 class APIClient:
@@ -15,13 +58,121 @@ class APIClient:
         """
         self.base_url = base_url
         self.timeout = 30.0
+        self._client: Optional[httpx.AsyncClient] = None
+        # Separate client for the long-lived event stream
+        self._stream_client: Optional[httpx.AsyncClient] = None
+        # GET requests currently on the wire, shared by concurrent identical calls
+        self._inflight: Dict[str, "asyncio.Task[Any]"] = {}
+        # Cached GET response bodies: request key -> (fetched_at, data)
+        self._response_cache: Dict[str, Tuple[float, Any]] = {}
+        # Customer profiles (or the error raised fetching them), least recently
+        # used first: customer id -> (expires_at, profile or error)
+        self._profile_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # Profiles being fetched (alone or in a batch): customer id -> future
+        # resolving to the profile, or None if it could not be loaded
+        self._profile_inflight: Dict[str, "asyncio.Future[Any]"] = {}
+        # Cleared the first time the API turns out not to have the bulk endpoint
+        self._bulk_customers_supported = True
+        # Same for the dashboard aggregate endpoint
+        self.dashboard_aggregate_supported = True
+        # And for the transactions event stream (callers then poll instead)
+        self.recent_stream_supported = True
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps connections alive between requests, so
+        concurrent and repeated calls don't pay a new connection setup.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=HTTP_LIMITS,
+                # Multiplexes concurrent requests over one connection; only
+                # negotiated over https, and needs h2
+                http2=HTTP2_AVAILABLE and self.base_url.startswith("https://"),
+            )
+        return self._client
+
+    def _get_stream_client(self) -> httpx.AsyncClient:
+        """Return the client used for the event stream, creating it on first use."""
+        if self._stream_client is None or self._stream_client.is_closed:
+            self._stream_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=STREAM_HTTP_LIMITS,
+            )
+        return self._stream_client
+
+    async def close(self):
+        """Close the HTTP clients and their pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._stream_client is not None:
+            await self._stream_client.aclose()
+            self._stream_client = None
+
+    async def __aenter__(self) -> "APIClient":
+        """Use the client as an async context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Close the client when leaving the context."""
+        await self.close()
     
-    async def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    @staticmethod
+    def _request_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache/in-flight key of a GET request."""
+        return f"{endpoint}?{urlencode(sorted((params or {}).items()))}"
+
+    def is_cached(self, endpoint: str, params: Optional[Dict[str, Any]] = None, ttl: float = RESPONSE_CACHE_TTL_SECONDS) -> bool:
+        """Check if a GET response is cached and younger than ttl.
+
+        Args:
+            endpoint: API endpoint path
+            params: Optional query parameters
+            ttl: Maximum age of the cached response in seconds
+
+        Returns:
+            True if the next call would be served from the cache
+        """
+        entry = self._response_cache.get(self._request_key(endpoint, params))
+        return entry is not None and (time.monotonic() - entry[0]) < ttl
+
+    def invalidate(self, endpoint: Optional[str] = None):
+        """Drop cached responses of an endpoint, or all of them.
+
+        Args:
+            endpoint: API endpoint path (all endpoints if omitted)
+        """
+        if endpoint is None:
+            self._response_cache.clear()
+            self._profile_cache.clear()
+            return
+        for key in [k for k in self._response_cache if k.split("?", 1)[0] == endpoint]:
+            del self._response_cache[key]
+
+    async def _get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: float = 0,
+        allow_empty_on_404: bool = False
+    ) -> Dict[str, Any]:
         """Make GET request to API.
+
+        Concurrent calls with the same endpoint and params share a single
+        request. With a ttl, the response body is cached and reused for that
+        many seconds.
         
         Args:
             endpoint: API endpoint path
             params: Optional query parameters
+            ttl: Seconds to reuse the response for (0 disables caching)
+            allow_empty_on_404: Return an empty list on 404, for list
+                endpoints where "not found" just means "no items"
             
         Returns:
             JSON response as dictionary
@@ -29,10 +180,52 @@ class APIClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}{endpoint}", params=params)
-            response.raise_for_status()
-            return response.json()
+        key = self._request_key(endpoint, params)
+        if ttl > 0 and self.is_cached(endpoint, params, ttl):
+            return self._response_cache[key][1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._request_json("GET", endpoint, allow_empty_on_404=allow_empty_on_404, params=params)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        # Shielded so a caller giving up doesn't cancel the request for the others
+        data = await asyncio.shield(task)
+        if ttl > 0:
+            self._response_cache[key] = (time.monotonic(), data)
+        return data
+
+    def _forget_inflight(self, key: str, task: "asyncio.Future[Any]"):
+        """Drop a finished request from the in-flight map."""
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # Mark retrieved in case every caller gave up
+
+    async def _request_json(self, method: str, endpoint: str, allow_empty_on_404: bool = False, **kwargs) -> Any:
+        """Send a request and decode its JSON body.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            allow_empty_on_404: Return an empty list instead of raising on 404
+            **kwargs: Extra arguments for httpx (params, content...)
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            httpx.HTTPError: If request fails
+        """
+        response = await self._get_client().request(method, endpoint, **kwargs)
+        if allow_empty_on_404 and response.status_code == 404:
+            return []
+        response.raise_for_status()
+        # Large bodies would block other sessions' events while parsing
+        if len(response.content) > LARGE_RESPONSE_BYTES:
+            return await asyncio.to_thread(orjson.loads, response.content)
+        return orjson.loads(response.content)
     
     async def _post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Make POST request to API.
@@ -47,10 +240,9 @@ class APIClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(f"{self.base_url}{endpoint}", json=data)
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_client().post(endpoint, content=orjson.dumps(data), headers=JSON_HEADERS)
+        response.raise_for_status()
+        return orjson.loads(response.content)
     
     async def _delete(self, endpoint: str) -> Dict[str, Any]:
         """Make DELETE request to API.
@@ -64,12 +256,11 @@ class APIClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.delete(f"{self.base_url}{endpoint}")
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_client().delete(endpoint)
+        response.raise_for_status()
+        return orjson.loads(response.content)
     
-    # ===== TRANSACTIONS (8 routes) =====
+    # ===== TRANSACTIONS (9 routes) =====
     
     async def get_transactions(
         self,
@@ -79,7 +270,9 @@ class APIClient:
         is_fraud: Optional[int] = None,
         min_amount: Optional[float] = None,
         max_amount: Optional[float] = None,
-        merchant_state: Optional[str] = None
+        merchant_state: Optional[str] = None,
+        after: Optional[str] = None,
+        include_total: bool = True
     ) -> Dict[str, Any]:
         """Get paginated list of transactions.
         
@@ -91,42 +284,89 @@ class APIClient:
             min_amount: Minimum transaction amount
             max_amount: Maximum transaction amount
             merchant_state: Filter by merchant state
+            after: Keyset cursor, the last transaction ID of the previous page.
+                Sent alongside ``page``: the backend's keyset support is not
+                confirmed, and offset-only backends must keep paging by
+                ``page``. A keyset backend takes ``after`` as authoritative.
+            include_total: Whether the total count is needed. When False,
+                ``include_total=false`` lets the backend skip counting;
+                backends that ignore it still return the total.
             
         Returns:
             TransactionList with pagination info
         """
-        params = {"page": page, "limit": limit}
-        if use_chip:
-            params["use_chip"] = use_chip
-        if is_fraud is not None:
-            params["isFraud"] = is_fraud
-        if min_amount is not None:
-            params["min_amount"] = min_amount
-        if max_amount is not None:
-            params["max_amount"] = max_amount
-        if merchant_state:
-            params["merchant_state"] = merchant_state
-        
+        raw = {
+            "page": page,
+            "limit": limit,
+            "use_chip": use_chip,
+            "isFraud": is_fraud,
+            "min_amount": min_amount,
+            "max_amount": max_amount,
+            "merchant_state": merchant_state,
+            "after": after,
+        }
+        # Only None and "" mean unset: 0 is a valid isFraud/amount filter
+        params = {k: v for k, v in raw.items() if v is not None and v != ""}
+        if not include_total:
+            params["include_total"] = "false"
+
         return await self._get("/api/transactions", params)
     
-    async def get_transaction_types(self) -> List[str]:
+    async def get_transaction_types(self, ttl: float = RESPONSE_CACHE_TTL_SECONDS) -> List[str]:
         """Get list of available transaction types.
         
+        Args:
+            ttl: Seconds a cached response is reused for (0 to bypass the cache)
+            
         Returns:
             List of transaction types (e.g., ['Swipe Transaction', 'Chip Transaction', 'Online Transaction'])
         """
-        return await self._get("/api/transactions/types")
+        return await self._get("/api/transactions/types", ttl=ttl)
     
-    async def get_recent_transactions(self, n: int = 10) -> List[Dict[str, Any]]:
+    async def get_recent_transactions(self, n: int = 10, ttl: float = 0) -> List[Dict[str, Any]]:
         """Get N most recent transactions.
         
         Args:
             n: Number of recent transactions (default: 10, max: 100)
+            ttl: Seconds a cached response is reused for (0 to always fetch)
             
         Returns:
             List of recent transactions
         """
-        return await self._get("/api/transactions/recent", {"n": n})
+        return await self._get("/api/transactions/recent", {"n": n}, ttl=ttl)
+
+    async def stream_recent_transactions(self) -> AsyncIterator[Dict[str, Any]]:
+        """Subscribe to new transactions as server-sent events.
+
+        The stream runs on a dedicated connection, outside the shared pool;
+        the app opens a single subscription and fans it out to sessions.
+
+        Yields nothing if the API has no stream endpoint, and remembers it so
+        later calls return at once (check recent_stream_supported to poll).
+
+        Yields:
+            Each transaction as the API publishes it
+
+        Raises:
+            httpx.HTTPError: If the stream cannot be opened, or goes idle
+                for STREAM_IDLE_TIMEOUT_SECONDS
+        """
+        if not self.recent_stream_supported:
+            return
+        timeout = httpx.Timeout(self.timeout, read=STREAM_IDLE_TIMEOUT_SECONDS)
+        async with self._get_stream_client().stream("GET", "/api/transactions/stream", timeout=timeout) as response:
+            if response.status_code in _BULK_UNSUPPORTED_STATUS:
+                self.recent_stream_supported = False
+                return
+            response.raise_for_status()
+            data_lines: List[str] = []
+            async for line in response.aiter_lines():
+                if line.startswith("data:"):
+                    data_lines.append(line[5:].lstrip())
+                elif not line and data_lines:
+                    # A blank line ends the event
+                    yield orjson.loads("\n".join(data_lines))
+                    data_lines = []
     
     async def search_transactions(
         self,
@@ -177,7 +417,7 @@ class APIClient:
         Returns:
             List of transactions (empty for this dataset)
         """
-        return await self._get(f"/api/transactions/to-customer/{customer_id}")
+        return await self._get(f"/api/transactions/to-customer/{customer_id}", allow_empty_on_404=True)
     
     async def get_transaction_by_id(self, transaction_id: str) -> Dict[str, Any]:
         """Get transaction details by ID.
@@ -201,7 +441,7 @@ class APIClient:
         """
         return await self._delete(f"/api/transactions/{transaction_id}")
     
-    # ===== CUSTOMERS (3 routes) =====
+    # ===== CUSTOMERS (4 routes) =====
     
     async def get_customers(self, page: int = 1, limit: int = 50) -> Dict[str, Any]:
         """Get paginated list of customers.
@@ -215,19 +455,73 @@ class APIClient:
         """
         return await self._get("/api/customers", {"page": page, "limit": limit})
     
-    async def get_top_customers(self, n: int = 10) -> List[Dict[str, Any]]:
+    async def get_top_customers(self, n: int = 10, ttl: float = RESPONSE_CACHE_TTL_SECONDS) -> List[Dict[str, Any]]:
         """Get top customers by transaction volume.
         
         Args:
             n: Number of top customers (default: 10, max: 100)
+            ttl: Seconds a cached response is reused for (0 to bypass the cache)
             
         Returns:
             List of top customers
         """
-        return await self._get("/api/customers/top", {"n": n})
+        return await self._get("/api/customers/top", {"n": n}, ttl=ttl)
     
+    def _cached_profile(self, customer_id: Any) -> Optional[Any]:
+        """Return the cached profile (or lookup error) of a customer, if fresh."""
+        key = str(customer_id)
+        entry = self._profile_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            del self._profile_cache[key]
+            return None
+        self._profile_cache.move_to_end(key)
+        return entry[1]
+
+    def _cached_profile_or_raise(self, customer_id: Any) -> Optional[Dict[str, Any]]:
+        """Return the cached profile of a customer, re-raising a cached lookup error."""
+        cached = self._cached_profile(customer_id)
+        if isinstance(cached, Exception):
+            raise cached
+        return cached
+
+    def _remember_profile(self, customer_id: Any, value: Any, ttl: float):
+        """Cache a profile (or lookup error), evicting the least recently used."""
+        key = str(customer_id)
+        self._profile_cache[key] = (time.monotonic() + ttl, value)
+        self._profile_cache.move_to_end(key)
+        if len(self._profile_cache) > PROFILE_CACHE_SIZE:
+            self._profile_cache.popitem(last=False)
+
+    def invalidate_customer(self, customer_id: Any):
+        """Drop the cached profile of a customer, e.g. after it was modified.
+
+        Args:
+            customer_id: Customer identifier
+        """
+        self._profile_cache.pop(str(customer_id), None)
+
+    def _settle_profiles(self, futures: Dict[str, "asyncio.Future[Any]"], profiles: Dict[str, Any]):
+        """Resolve in-flight profile futures and stop tracking them.
+
+        Args:
+            futures: Futures owned by the caller, by customer id
+            profiles: Profiles loaded, by customer id (others resolve to None)
+        """
+        for key, future in futures.items():
+            if not future.done():
+                future.set_result(profiles.get(key))
+            if self._profile_inflight.get(key) is future:
+                del self._profile_inflight[key]
+
     async def get_customer_profile(self, customer_id: int) -> Dict[str, Any]:
         """Get customer profile with transaction summary.
+
+        Profiles are cached for PROFILE_CACHE_TTL_SECONDS. Failed lookups are
+        remembered for PROFILE_FAILURE_TTL_SECONDS so retries don't hammer
+        the API. A profile already being fetched, alone or as part of
+        get_customer_profiles, is awaited instead of requested again.
         
         Args:
             customer_id: Customer identifier
@@ -235,65 +529,214 @@ class APIClient:
         Returns:
             Customer profile with stats
         """
-        return await self._get(f"/api/customers/{customer_id}")
+        cached = self._cached_profile_or_raise(customer_id)
+        if cached is not None:
+            return cached
+
+        key = str(customer_id)
+        pending = self._profile_inflight.get(key)
+        if pending is not None:
+            profile = await asyncio.shield(pending)
+            if profile is not None:
+                return profile
+            # A failed fetch left its error in the cache: reuse it
+            cached = self._cached_profile_or_raise(customer_id)
+            if cached is not None:
+                return cached
+            # The batch it was part of did not return it: ask on its own
+            return await self._load_profile(customer_id)
+
+        future = asyncio.get_running_loop().create_future()
+        self._profile_inflight[key] = future
+        loaded: Dict[str, Any] = {}
+        try:
+            loaded[key] = await self._load_profile(customer_id)
+            return loaded[key]
+        finally:
+            self._settle_profiles({key: future}, loaded)
+
+    async def _load_profile(self, customer_id: int) -> Dict[str, Any]:
+        """Request a customer profile and cache the outcome.
+
+        Args:
+            customer_id: Customer identifier
+
+        Returns:
+            Customer profile with stats
+        """
+        try:
+            profile = await self._get(f"/api/customers/{customer_id}")
+        except httpx.HTTPError as e:
+            self._remember_profile(customer_id, e, PROFILE_FAILURE_TTL_SECONDS)
+            raise
+        self._remember_profile(customer_id, profile, PROFILE_CACHE_TTL_SECONDS)
+        return profile
+
+    async def get_customers_bulk(self, ids: List[int]) -> List[Dict[str, Any]]:
+        """Get several customer profiles in a single request.
+
+        Args:
+            ids: Customer identifiers
+
+        Returns:
+            List of customer profiles
+        """
+        return await self._post("/api/customers/bulk", {"ids": ids})
+
+    async def get_customer_profiles(self, ids: List[int]) -> List[Dict[str, Any]]:
+        """Get customer profiles, in one request when the API supports it.
+
+        Falls back to per-customer requests (at most PROFILE_FETCH_CONCURRENCY
+        at a time) if the bulk endpoint is missing, and remembers it so later
+        calls go straight there.
+
+        Profiles still in the profile cache, or already being fetched by
+        another call, are not requested again. Failed lookups are cached
+        like in get_customer_profile, so they are not retried either.
+
+        Args:
+            ids: Customer identifiers
+
+        Returns:
+            List of customer profiles, in the order of ids (profiles that
+            fail to load are skipped)
+        """
+        profiles: Dict[str, Any] = {}
+        pending: Dict[str, "asyncio.Future[Any]"] = {}
+        missing = []
+        for cid in ids:
+            key = str(cid)
+            cached = self._cached_profile(cid)
+            if cached is not None:
+                if not isinstance(cached, Exception):
+                    profiles[key] = cached
+            elif key in self._profile_inflight:
+                pending[key] = self._profile_inflight[key]
+            else:
+                missing.append(cid)
+
+        # Claim the missing ids, so concurrent calls wait for this fetch
+        loop = asyncio.get_running_loop()
+        owned = {str(cid): loop.create_future() for cid in missing}
+        self._profile_inflight.update(owned)
+        try:
+            for profile in await self._fetch_profiles(missing) if missing else []:
+                profiles[str(profile.get("id"))] = profile
+                self._remember_profile(profile.get("id"), profile, PROFILE_CACHE_TTL_SECONDS)
+        except httpx.HTTPError as e:
+            # Remembered per customer, so waiters and retries don't re-ask
+            for cid in missing:
+                self._remember_profile(cid, e, PROFILE_FAILURE_TTL_SECONDS)
+            raise
+        finally:
+            self._settle_profiles(owned, profiles)
+
+        waited = await asyncio.gather(*(asyncio.shield(future) for future in pending.values()))
+        for key, profile in zip(pending, waited):
+            if profile is None:
+                # The fetch it waited for failed or skipped it: use what it cached
+                profile = self._cached_profile(key)
+            if profile is not None and not isinstance(profile, Exception):
+                profiles[key] = profile
+        return [profiles[str(cid)] for cid in ids if str(cid) in profiles]
+
+    async def _fetch_profiles(self, ids: List[int]) -> List[Dict[str, Any]]:
+        """Fetch customer profiles, in one request when the API supports it.
+
+        Args:
+            ids: Customer identifiers
+
+        Returns:
+            Fetched profiles (profiles that fail to load are skipped)
+        """
+        if self._bulk_customers_supported:
+            try:
+                return await self.get_customers_bulk(ids)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in _BULK_UNSUPPORTED_STATUS:
+                    raise
+                self._bulk_customers_supported = False
+
+        semaphore = asyncio.Semaphore(PROFILE_FETCH_CONCURRENCY)
+
+        async def fetch(cid: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._load_profile(cid)
+
+        results = await asyncio.gather(*(fetch(cid) for cid in ids), return_exceptions=True)
+        return [r for r in results if not isinstance(r, Exception)]
     
     # ===== STATS (4 routes) =====
     
-    async def get_stats_overview(self) -> Dict[str, Any]:
+    async def get_stats_overview(self, ttl: float = RESPONSE_CACHE_TTL_SECONDS) -> Dict[str, Any]:
         """Get overall statistics of the dataset.
         
+        Args:
+            ttl: Seconds a cached response is reused for (0 to bypass the cache)
+            
         Returns:
             Overall statistics including total transactions, fraud rate, etc.
         """
-        return await self._get("/api/stats/overview")
+        return await self._get("/api/stats/overview", ttl=ttl)
     
-    async def get_amount_distribution(self, bins: int = 10) -> Dict[str, Any]:
+    async def get_amount_distribution(self, bins: int = 10, ttl: float = RESPONSE_CACHE_TTL_SECONDS) -> Dict[str, Any]:
         """Get distribution of transaction amounts.
         
         Args:
             bins: Number of histogram bins (default: 10, range: 5-50)
+            ttl: Seconds a cached response is reused for (0 to bypass the cache)
             
         Returns:
             Distribution with bin labels and counts
         """
-        return await self._get("/api/stats/amount-distribution", {"bins": bins})
+        return await self._get("/api/stats/amount-distribution", {"bins": bins}, ttl=ttl)
     
-    async def get_stats_by_type(self) -> List[Dict[str, Any]]:
+    async def get_stats_by_type(self, ttl: float = RESPONSE_CACHE_TTL_SECONDS) -> List[Dict[str, Any]]:
         """Get statistics grouped by transaction type.
         
+        Args:
+            ttl: Seconds a cached response is reused for (0 to bypass the cache)
+            
         Returns:
             List of statistics for each transaction type
         """
-        return await self._get("/api/stats/by-type")
+        return await self._get("/api/stats/by-type", ttl=ttl)
     
-    async def get_daily_stats(self, limit: int = 30) -> List[Dict[str, Any]]:
+    async def get_daily_stats(self, limit: int = 30, ttl: float = RESPONSE_CACHE_TTL_SECONDS) -> List[Dict[str, Any]]:
         """Get statistics grouped by day.
         
         Args:
             limit: Maximum number of days to return (default: 30, 0 for all)
+            ttl: Seconds a cached response is reused for (0 to bypass the cache)
             
         Returns:
             List of daily statistics
         """
-        return await self._get("/api/stats/daily", {"limit": limit})
+        return await self._get("/api/stats/daily", {"limit": limit}, ttl=ttl)
     
     # ===== FRAUD (3 routes) =====
     
-    async def get_fraud_summary(self) -> Dict[str, Any]:
+    async def get_fraud_summary(self, ttl: float = RESPONSE_CACHE_TTL_SECONDS) -> Dict[str, Any]:
         """Get fraud detection summary.
         
+        Args:
+            ttl: Seconds a cached response is reused for (0 to bypass the cache)
+            
         Returns:
             Summary of fraud statistics
         """
-        return await self._get("/api/fraud/summary")
+        return await self._get("/api/fraud/summary", ttl=ttl)
     
-    async def get_fraud_by_type(self) -> List[Dict[str, Any]]:
+    async def get_fraud_by_type(self, ttl: float = RESPONSE_CACHE_TTL_SECONDS) -> List[Dict[str, Any]]:
         """Get fraud statistics by transaction type.
         
+        Args:
+            ttl: Seconds a cached response is reused for (0 to bypass the cache)
+            
         Returns:
             List of fraud rates and counts for each transaction type
         """
-        return await self._get("/api/fraud/by-type")
+        return await self._get("/api/fraud/by-type", ttl=ttl)
     
     async def predict_fraud(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Predict if a transaction is fraudulent.
@@ -306,20 +749,79 @@ class APIClient:
         """
         return await self._post("/api/fraud/predict", data)
     
+    # ===== AGGREGATES (1 route) =====
+
+    async def get_dashboard_aggregate(self, n: int = 10) -> Optional[Dict[str, Any]]:
+        """Get everything the dashboard shows in a single request.
+
+        The overview, health and metadata parts are stored in the response
+        cache as if fetched from their own endpoints.
+
+        Args:
+            n: Number of recent transactions
+
+        Returns:
+            Dict with stats_overview, recent_transactions, health and
+            metadata, or None if the API has no aggregate endpoint or the
+            request failed (the parts must then be fetched separately)
+        """
+        if not self.dashboard_aggregate_supported:
+            return None
+        try:
+            data = await self._post("/api/aggregate/dashboard", {"recent_n": n})
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in _BULK_UNSUPPORTED_STATUS:
+                self.dashboard_aggregate_supported = False
+            return None
+        except (httpx.HTTPError, ValueError):
+            # Transport errors, timeouts and undecodable bodies: the
+            # separate endpoints may still answer
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        now = time.monotonic()
+        for field, endpoint in _DASHBOARD_AGGREGATE_PARTS.items():
+            if field in data:
+                self._response_cache[self._request_key(endpoint, None)] = (now, data[field])
+        return data
+
     # ===== SYSTEM (2 routes) =====
     
-    async def get_health(self) -> Dict[str, Any]:
+    async def get_health(self, ttl: float = RESPONSE_CACHE_TTL_SECONDS) -> Dict[str, Any]:
         """Check system health status.
         
+        Args:
+            ttl: Seconds a cached response is reused for (0 to bypass the cache)
+            
         Returns:
             System health information
         """
-        return await self._get("/api/system/health")
+        return await self._get("/api/system/health", ttl=ttl)
     
-    async def get_metadata(self) -> Dict[str, Any]:
+    async def get_metadata(self, ttl: float = RESPONSE_CACHE_TTL_SECONDS) -> Dict[str, Any]:
         """Get system metadata.
         
+        Args:
+            ttl: Seconds a cached response is reused for (0 to bypass the cache)
+            
         Returns:
             System metadata including version, endpoint count, etc.
         """
-        return await self._get("/api/system/metadata")
+        return await self._get("/api/system/metadata", ttl=ttl)
+
+
+# Process-wide client, so every caller shares one connection pool and cache
+_default_client: Optional[APIClient] = None
+
+
+def get_api_client() -> APIClient:
+    """Return the shared API client, creating it on first use.
+
+    Returns:
+        The process-wide APIClient
+    """
+    global _default_client
+    if _default_client is None:
+        _default_client = APIClient()
+    return _default_client
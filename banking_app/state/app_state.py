@@ -1,23 +1,361 @@
 """Application State Management with caching and optimizations."""
 
 import reflex as rx
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable, Awaitable
 import asyncio
 import time
-from ..services.api_client import APIClient
-from ..models import Transaction, Customer, FraudStat, DailyStat, TypeStat
+from collections import OrderedDict
+from ..services.api_client import get_api_client
+from ..models import Transaction, RecentTransaction, Customer, FraudStat, DailyStat, TypeStat
 
-# Initialize API client outside of State class to avoid serialization issues
-api_client = APIClient()
+# Shared API client, kept outside of State classes to avoid serialization issues
+api_client = get_api_client()
 
 # Constants
 ITEMS_PER_PAGE = 50
+# Largest page the tables render: rows are not windowed, so pages stay
+# small enough to mount at once (the API itself serves up to 100)
+MAX_ITEMS_PER_PAGE = 50
 CACHE_TTL_SECONDS = 60  # Cache duration in seconds
-TOP_CUSTOMERS_LIMIT = 10
 RECENT_TRANSACTIONS_LIMIT = 10
 DAILY_STATS_LIMIT = 30
 AMOUNT_DISTRIBUTION_BINS = 10
 
+# Response cache TTLs for slowly changing endpoints (in seconds)
+STATS_OVERVIEW_TTL_SECONDS = 30
+HEALTH_TTL_SECONDS = 15
+METADATA_TTL_SECONDS = 300
+TRANSACTION_TYPES_TTL_SECONDS = 300
+FRAUD_STATS_TTL_SECONDS = 300
+DROPDOWN_OPTIONS_TTL_SECONDS = 3600
+DROPDOWN_OPTIONS_CACHE_KEY = "dropdown_options"
+PREDICTION_CACHE_SIZE = 128
+TRANSACTIONS_PAGE_CACHE_SIZE = 32
+RECENT_WATCH_POLL_SECONDS = 5  # How often an idle watcher checks its tab is still on the dashboard
+RECENT_WATCH_HEARTBEAT_SECONDS = 15  # How often a dashboard tab reports it is still open
+RECENT_WATCH_STALE_SECONDS = 3 * RECENT_WATCH_HEARTBEAT_SECONDS  # Missed heartbeats before a watcher stops
+RECENT_POLL_SECONDS = 10  # Refetch interval when the API has no event stream
+
+# Per-process cache of data derived from API responses (raw responses are
+# cached by APIClient), shared by all sessions: key -> (fetched_at, data)
+_response_cache: Dict[str, Tuple[float, Any]] = {}
+
+
+def _total_pages(total: int, per_page: int) -> int:
+    """Number of pages for total items, 1 when there are none."""
+    return max(-(-total // max(per_page, 1)), 1)
+
+
+def _is_response_cached(key: str, ttl: float) -> bool:
+    """Check if a cached value exists and is younger than ttl."""
+    entry = _response_cache.get(key)
+    return entry is not None and (time.monotonic() - entry[0]) < ttl
+
+
+async def _get_cached(key: str, fetch: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+    """Return the cached value for key, or await fetch() and cache it.
+
+    Args:
+        key: Cache key
+        fetch: Coroutine factory performing the actual request
+        ttl: Time to live of the cached response in seconds
+
+    Returns:
+        Response data
+    """
+    if _is_response_cached(key, ttl):
+        return _response_cache[key][1]
+    data = await fetch()
+    _response_cache[key] = (time.monotonic(), data)
+    return data
+
+
+# Per-process LRU of fraud predictions: (amount, use_chip, merchant_state, mcc) -> result
+_prediction_cache: "OrderedDict[Tuple[float, str, str, int], Dict[str, Any]]" = OrderedDict()
+
+
+# Per-process LRU of built transaction pages: page key -> (fetched_at, rows, total)
+_transactions_page_cache: "OrderedDict[Tuple, Tuple[float, List[Transaction], int]]" = OrderedDict()
+
+
+# Totals of recent transaction queries, per filter set: filter key -> (fetched_at, total)
+_transaction_totals: Dict[Tuple, Tuple[float, int]] = {}
+
+# Query parameters that select a page within a result set, not the set itself
+_PAGING_PARAMS = frozenset(("page", "limit", "after"))
+
+
+# Pages fetched ahead of time, shared by all sessions: key -> (started_at, task)
+_prefetched_pages: Dict[Tuple, Tuple[float, "asyncio.Task[Any]"]] = {}
+
+
+def _prefetch(key: Tuple, fetch: Callable[[], Awaitable[Any]]):
+    """Start fetching a page in the background so it is ready when requested.
+
+    Args:
+        key: Page key, as passed later to _take_prefetched
+        fetch: Coroutine factory performing the actual request
+    """
+    now = time.monotonic()
+    for stale in [k for k, (started, _) in _prefetched_pages.items() if now - started >= CACHE_TTL_SECONDS]:
+        del _prefetched_pages[stale]
+    if key in _prefetched_pages:
+        return
+
+    async def run():
+        try:
+            return await fetch()
+        except Exception:
+            # Best effort: the page is fetched normally when requested
+            return None
+
+    _prefetched_pages[key] = (now, asyncio.create_task(run()))
+
+
+async def _take_prefetched(key: Tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the prefetched page for key, or await fetch().
+
+    Args:
+        key: Page key
+        fetch: Coroutine factory performing the actual request
+
+    Returns:
+        Page data
+    """
+    entry = _prefetched_pages.pop(key, None)
+    if entry is not None and time.monotonic() - entry[0] < CACHE_TTL_SECONDS:
+        data = await entry[1]
+        if data is not None:
+            return data
+    return await fetch()
+
+
+async def _build_models(build: Callable[[Dict[str, Any]], Any], items: List[Dict[str, Any]]) -> List[Any]:
+    """Build models from API items in a worker thread.
+
+    Keeps model validation of whole pages off the event loop, so other
+    sessions' events are not held up meanwhile.
+
+    Args:
+        build: Model factory (e.g. Transaction.from_api)
+        items: Raw API items
+
+    Returns:
+        List of models
+    """
+    return await asyncio.to_thread(lambda: [build(item) for item in items if item])
+
+
+async def _fetch_customers_page(page: int, limit: int) -> Tuple[List[Customer], int]:
+    """Fetch one page of customers with their profiles.
+
+    Args:
+        page: Page number to fetch
+        limit: Customers per page
+
+    Returns:
+        Tuple of (customers, total customer count)
+    """
+    result = await api_client.get_customers(page=page, limit=limit)
+    raw_customers = result.get("customers", [])
+    customers_data = []
+
+    # Check if we got a list of IDs (int) instead of objects
+    if raw_customers and isinstance(raw_customers[0], int):
+        # Fetch the details of the whole page at once
+        customers_data = await api_client.get_customer_profiles(raw_customers)
+    else:
+        customers_data = raw_customers
+
+    customers = await asyncio.to_thread(Customer.many_from_api, customers_data)
+    return customers, result.get("total", 0)
+
+
+def _transactions_page_key(query: Dict[str, Any]) -> Tuple:
+    """Build the cache and prefetch key of a transactions page request."""
+    return ("transactions",) + tuple(sorted(query.items()))
+
+
+def _transactions_filter_key(query: Dict[str, Any]) -> Tuple:
+    """Build the key of the filter set of a transactions page request."""
+    return tuple(sorted((k, v) for k, v in query.items() if k not in _PAGING_PARAMS))
+
+
+def _cached_transactions_total(filter_key: Tuple) -> Optional[int]:
+    """Return the recently fetched total matching a filter set, if any."""
+    entry = _transaction_totals.get(filter_key)
+    if entry is None or time.monotonic() - entry[0] >= CACHE_TTL_SECONDS:
+        return None
+    return entry[1]
+
+
+def _store_transactions_total(filter_key: Tuple, total: int):
+    """Remember the total of a filter set, dropping expired totals."""
+    now = time.monotonic()
+    for stale in [k for k, (fetched, _) in _transaction_totals.items() if now - fetched >= CACHE_TTL_SECONDS]:
+        del _transaction_totals[stale]
+    _transaction_totals[filter_key] = (now, total)
+
+
+def _cached_transactions_page(key: Tuple) -> Optional[Tuple[List[Transaction], int]]:
+    """Return (rows, total) for a recently loaded transactions page, if any."""
+    entry = _transactions_page_cache.get(key)
+    if entry is None or time.monotonic() - entry[0] >= CACHE_TTL_SECONDS:
+        return None
+    _transactions_page_cache.move_to_end(key)
+    return entry[1], entry[2]
+
+
+def _store_transactions_page(key: Tuple, rows: List[Transaction], total: int):
+    """Remember a loaded transactions page, evicting the least recently used."""
+    _transactions_page_cache[key] = (time.monotonic(), rows, total)
+    _transactions_page_cache.move_to_end(key)
+    if len(_transactions_page_cache) > TRANSACTIONS_PAGE_CACHE_SIZE:
+        _transactions_page_cache.popitem(last=False)
+
+
+async def _fetch_transactions_page(query: Dict[str, Any]) -> Tuple[List[Transaction], int]:
+    """Fetch and build one transactions page, and cache it.
+
+    Used both for loads and for prefetches, so a prefetched page is stored
+    ready to display.
+
+    Args:
+        query: get_transactions arguments
+
+    Returns:
+        Tuple of (transactions, total matching the filters)
+    """
+    # The total only depends on the filters: once known, pages are requested
+    # without it (backends may then skip the count)
+    filter_key = _transactions_filter_key(query)
+    known_total = _cached_transactions_total(filter_key)
+    result = await api_client.get_transactions(**query, include_total=known_total is None)
+
+    # Filtering and paging are done by the API; only ever build one page of
+    # rows, whatever it sends back
+    items = result.get("transactions", [])[:query["limit"]]
+    rows = await _build_models(Transaction.from_api, items)
+    total = result.get("total")
+    if total is None:
+        total = known_total or 0
+    else:
+        _store_transactions_total(filter_key, total)
+    _store_transactions_page(_transactions_page_key(query), rows, total)
+    return rows, total
+
+
+# Dashboard tabs watching new transactions: client token -> queue of pushed
+# transactions (None tells the watcher to stop)
+_recent_watchers: Dict[str, "asyncio.Queue[Optional[Dict[str, Any]]]"] = {}
+# Single subscription to the API's event stream, shared by every watcher
+_recent_stream_task: Optional["asyncio.Task[None]"] = None
+# Serializes watcher registration with opening and closing the stream
+_recent_watchers_lock = asyncio.Lock()
+
+
+def _offer_recent(queue: "asyncio.Queue[Optional[Dict[str, Any]]]", item: Optional[Dict[str, Any]]):
+    """Queue an item for a watcher, dropping its oldest one if it is behind."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+def _fan_out_recent(item: Dict[str, Any]):
+    """Hand a new transaction to every watcher."""
+    for queue in list(_recent_watchers.values()):
+        _offer_recent(queue, item)
+
+
+async def _poll_recent_transactions():
+    """Refetch recent transactions periodically, fanning out the new ones.
+
+    Used when the API has no event stream. The first poll only records what
+    is already shown.
+    """
+    seen: Optional[set] = None
+    while True:
+        try:
+            items = await api_client.get_recent_transactions(
+                RECENT_TRANSACTIONS_LIMIT, ttl=RECENT_POLL_SECONDS
+            )
+        except Exception:
+            # Transient failure: try again on the next poll
+            items = None
+        if items is not None:
+            ids = {str(item.get("id")) for item in items}
+            if seen is not None:
+                # Oldest first, as watchers prepend each item
+                for item in reversed(items):
+                    if str(item.get("id")) not in seen:
+                        _fan_out_recent(item)
+            seen = ids
+        await asyncio.sleep(RECENT_POLL_SECONDS)
+
+
+async def _pump_recent_transactions():
+    """Read the API's event stream and fan every transaction out to the watchers."""
+    try:
+        async for item in api_client.stream_recent_transactions():
+            _fan_out_recent(item)
+        if not api_client.recent_stream_supported:
+            await _poll_recent_transactions()
+    except Exception:
+        # Dropped stream: dashboards pick up new transactions on their next load
+        pass
+    finally:
+        # A cancelled pump may already be replaced: only the current one
+        # stops the watchers
+        if asyncio.current_task() is _recent_stream_task:
+            for queue in list(_recent_watchers.values()):
+                _offer_recent(queue, None)
+
+
+async def _watch_recent(token: str) -> "asyncio.Queue[Optional[Dict[str, Any]]]":
+    """Register a tab's watcher, opening the shared stream if needed.
+
+    An earlier watcher of the same tab (e.g. from a previous mount) is told
+    to stop.
+
+    Args:
+        token: Client token of the tab
+
+    Returns:
+        Queue the watcher receives transactions from
+    """
+    global _recent_stream_task
+    async with _recent_watchers_lock:
+        previous = _recent_watchers.get(token)
+        if previous is not None:
+            _offer_recent(previous, None)
+        queue: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue(maxsize=RECENT_TRANSACTIONS_LIMIT)
+        _recent_watchers[token] = queue
+        if _recent_stream_task is None or _recent_stream_task.done():
+            _recent_stream_task = asyncio.ensure_future(_pump_recent_transactions())
+        return queue
+
+
+async def _unwatch_recent(token: str, queue: "asyncio.Queue[Optional[Dict[str, Any]]]") -> bool:
+    """Unregister a watcher, closing the shared stream once nobody watches.
+
+    Args:
+        token: Client token of the tab
+        queue: Queue returned by _watch_recent
+
+    Returns:
+        Whether it was still the tab's current watcher
+    """
+    global _recent_stream_task
+    async with _recent_watchers_lock:
+        if _recent_watchers.get(token) is not queue:
+            return False
+        del _recent_watchers[token]
+        if not _recent_watchers and _recent_stream_task is not None:
+            _recent_stream_task.cancel()
+            _recent_stream_task = None
+        return True
+
+
 # Default filter options
 US_STATES = [
     "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
@@ -32,6 +370,85 @@ COMMON_MCC_CODES = [
     "5542", "5812", "5813", "5912", "5999"
 ]
 
+TRANSACTION_TYPES = ["Swipe Transaction", "Chip Transaction", "Online Transaction"]
+
+# Membership lookups for the defaults above
+_DEFAULT_STATES = frozenset(US_STATES)
+_DEFAULT_MCC_CODES = frozenset(COMMON_MCC_CODES)
+
+
+async def _fetch_dropdown_options() -> Tuple[List[str], List[str]]:
+    """Collect merchant states and MCC codes seen in a transaction sample.
+
+    Only values missing from the static defaults are kept.
+
+    Returns:
+        Tuple of (extra merchant states, extra MCC codes)
+    """
+    tx_data = await api_client.get_transactions(limit=100)
+    states: set = set()
+    mccs: set = set()
+    # Single pass over the sample, skipping values the defaults already have
+    for t in tx_data.get("transactions", []):
+        state = t.get("merchant_state")
+        if state and state not in _DEFAULT_STATES:
+            states.add(state)
+        mcc = t.get("mcc")
+        if mcc and str(mcc) not in _DEFAULT_MCC_CODES:
+            mccs.add(str(mcc))
+    return sorted(states), sorted(mccs)
+
+
+async def warmup_caches():
+    """Fill the per-process response caches before the first page visit.
+
+    Warms what the pages fetch on mount and keep cached long enough to be
+    read: the dashboard through its aggregate endpoint (or the separate
+    endpoints when the API has none), the fraud statistics, transaction
+    types and dropdown options. Failures are ignored: each page fetches
+    whatever is missing on mount.
+    """
+    await asyncio.gather(
+        _warmup_dashboard(),
+        api_client.get_fraud_summary(ttl=FRAUD_STATS_TTL_SECONDS),
+        api_client.get_fraud_by_type(ttl=FRAUD_STATS_TTL_SECONDS),
+        api_client.get_transaction_types(ttl=TRANSACTION_TYPES_TTL_SECONDS),
+        _get_cached(DROPDOWN_OPTIONS_CACHE_KEY, _fetch_dropdown_options, DROPDOWN_OPTIONS_TTL_SECONDS),
+        return_exceptions=True
+    )
+
+
+async def _warmup_dashboard():
+    """Cache the dashboard's overview, health and metadata responses."""
+    aggregate = await api_client.get_dashboard_aggregate(RECENT_TRANSACTIONS_LIMIT)
+    if aggregate is None and not api_client.dashboard_aggregate_supported:
+        await asyncio.gather(
+            api_client.get_stats_overview(ttl=STATS_OVERVIEW_TTL_SECONDS),
+            api_client.get_health(ttl=HEALTH_TTL_SECONDS),
+            api_client.get_metadata(ttl=METADATA_TTL_SECONDS),
+            return_exceptions=True
+        )
+
+
+def _merge_options(current: List[str], found: List[str]) -> Optional[List[str]]:
+    """Merge newly found dropdown options into the current ones.
+
+    Args:
+        current: Current option list
+        found: Options seen in fetched data
+
+    Returns:
+        Sorted merged list, or None if there is nothing new
+    """
+    # Usual case: the same cached sample as last time, nothing to rebuild
+    if not found or found == current:
+        return None
+    current_set = set(current)
+    new_options = set(found) - current_set
+    if not new_options:
+        return None
+    return sorted(current_set | new_options)
+
 
 class AppState(rx.State):
     """Main application state with caching and optimizations."""
@@ -45,41 +462,25 @@ class AppState(rx.State):
 
     # Dashboard data
     stats_overview: Dict[str, Any] = {}
-    recent_transactions: List[Transaction] = []
+    recent_transactions: List[RecentTransaction] = []
+    # Current recent transactions watcher of this tab ("" when none) and when
+    # the tab last reported the dashboard open; kept in state so any worker
+    # can stop the watcher
+    _recent_watch_id: str = ""
+    _recent_heartbeat: float = 0.0
     system_health: Dict[str, Any] = {}
     system_metadata: Dict[str, Any] = {}
 
-    # Transactions data
-    transactions: List[Transaction] = []
-    transaction_types: List[str] = []
-    total_transactions: int = 0
-    current_page: int = 1
+    # Pagination (shared by transactions and customers)
     items_per_page: int = ITEMS_PER_PAGE
 
-    # Filters
-    filter_use_chip: str = ""
-    filter_is_fraud: Optional[int] = None
-    filter_min_amount: str = ""
-    filter_max_amount: str = ""
-    filter_merchant_state: str = ""
-
     # Customers data
     customers: List[Customer] = []
-    top_customers: List[Customer] = []
     customer_profile: Dict[str, Any] = {}
     total_customers: int = 0
     customers_page: int = 1
     search_customer_id: str = ""
 
-    # Fraud data
-    fraud_summary: Dict[str, Any] = {}
-    fraud_by_type: List[FraudStat] = []
-    fraud_prediction: Dict[str, Any] = {}
-    
-    # Form Options
-    merchant_states: List[str] = US_STATES
-    mcc_codes: List[str] = COMMON_MCC_CODES
-
     # Stats data
     amount_distribution: Dict[str, Any] = {}
     stats_by_type: List[TypeStat] = []
@@ -104,41 +505,65 @@ class AppState(rx.State):
         else:
             self._cache_timestamps = {}
 
-    # ===== SETTER METHODS FOR FILTERS =====
-
-    def set_filter_use_chip(self, value: str):
-        """Set transaction type filter."""
-        self.filter_use_chip = value if value != "All" else ""
-
-    def set_filter_min_amount(self, value: str):
-        """Set minimum amount filter."""
-        self.filter_min_amount = value
-
-    def set_filter_max_amount(self, value: str):
-        """Set maximum amount filter."""
-        self.filter_max_amount = value
-
-    def set_filter_merchant_state(self, value: str):
-        """Set merchant state filter."""
-        self.filter_merchant_state = value
-
-    def set_filter_is_fraud(self, value: str):
-        """Set fraud filter from dropdown value."""
-        if value == "Fraudulent":
-            self.filter_is_fraud = 1
-        elif value == "Legitimate":
-            self.filter_is_fraud = 0
-        else:
-            self.filter_is_fraud = None
-
-    def reset_filters(self):
-        """Reset all transaction filters."""
-        self.filter_use_chip = ""
-        self.filter_is_fraud = None
-        self.filter_min_amount = ""
-        self.filter_max_amount = ""
-        self.filter_merchant_state = ""
-        self.current_page = 1
+    # ===== COMPUTED VARS =====
+
+    @rx.var(cache=True)
+    def total_transactions_str(self) -> str:
+        """Total transaction count from the stats overview."""
+        return str(self.stats_overview.get("total_transactions", 0))
+
+    @rx.var(cache=True)
+    def total_amount_str(self) -> str:
+        """Total transaction amount formatted as currency."""
+        return f"${float(self.stats_overview.get('total_amount', 0) or 0):,.2f}"
+
+    @rx.var(cache=True)
+    def total_volume_str(self) -> str:
+        """Total transaction amount rounded to whole dollars."""
+        return f"${float(self.stats_overview.get('total_amount', 0) or 0):,.0f}"
+
+    @rx.var(cache=True)
+    def avg_amount_str(self) -> str:
+        """Average transaction amount formatted as currency."""
+        return f"${float(self.stats_overview.get('avg_amount', 0) or 0):,.2f}"
+
+    @rx.var(cache=True)
+    def fraud_rate_pct_str(self) -> str:
+        """Overall fraud rate formatted as a percentage."""
+        return f"{float(self.stats_overview.get('fraud_rate', 0) or 0) * 100:.2f}%"
+
+    @rx.var(cache=True)
+    def show_stats(self) -> bool:
+        """Whether the dashboard statistics cards should be shown."""
+        return not self.is_loading and bool(self.stats_overview)
+
+    @rx.var(cache=True)
+    def show_recent(self) -> bool:
+        """Whether the dashboard recent transactions table should be shown."""
+        return not self.is_loading and bool(self.recent_transactions)
+
+    @rx.var(cache=True)
+    def show_system_status(self) -> bool:
+        """Whether the dashboard system status cards should be shown."""
+        return not self.is_loading and bool(self.system_health)
+
+    @rx.var(cache=True)
+    def show_customers_table(self) -> bool:
+        """Whether the customers table should be shown."""
+        return not self.is_loading and bool(self.customers)
+
+    @rx.var(cache=True)
+    def customers_total_pages(self) -> int:
+        """Number of customer pages (at least 1, so captions never show "of 0")."""
+        return _total_pages(self.total_customers, self.items_per_page)
+
+    # ===== SETTER METHODS FOR PAGINATION =====
+
+    def set_items_per_page(self, value: int):
+        """Set page size, clamped to what a table renders in one page."""
+        value = max(1, min(int(value), MAX_ITEMS_PER_PAGE))
+        if value != self.items_per_page:
+            self.items_per_page = value
 
     # ===== SETTER METHODS FOR CUSTOMERS =====
 
@@ -164,28 +589,43 @@ class AppState(rx.State):
             self.recent_transactions):
             return
 
-        self.is_loading = True
+        # Don't flash the spinner when the slow-changing data is cached
+        all_cached = (
+            api_client.is_cached("/api/stats/overview", ttl=STATS_OVERVIEW_TTL_SECONDS)
+            and api_client.is_cached("/api/system/health", ttl=HEALTH_TTL_SECONDS)
+            and api_client.is_cached("/api/system/metadata", ttl=METADATA_TTL_SECONDS)
+        )
+        self.is_loading = not all_cached
         self.error_message = ""
         try:
-            # Load all data in parallel for better performance
-            results = await asyncio.gather(
-                api_client.get_stats_overview(),
-                api_client.get_recent_transactions(RECENT_TRANSACTIONS_LIMIT),
-                api_client.get_health(),
-                api_client.get_metadata(),
-                return_exceptions=True
-            )
+            # Cold load: everything in one request when the API supports it
+            aggregate = None if all_cached else await api_client.get_dashboard_aggregate(RECENT_TRANSACTIONS_LIMIT)
+            if aggregate is not None:
+                # Parts missing from the response are left as they are
+                results = [
+                    aggregate[field] if field in aggregate else KeyError(field)
+                    for field in ("stats_overview", "health", "metadata", "recent_transactions")
+                ]
+            else:
+                # Load all data in parallel for better performance
+                results = await asyncio.gather(
+                    api_client.get_stats_overview(ttl=STATS_OVERVIEW_TTL_SECONDS),
+                    api_client.get_health(ttl=HEALTH_TTL_SECONDS),
+                    api_client.get_metadata(ttl=METADATA_TTL_SECONDS),
+                    api_client.get_recent_transactions(RECENT_TRANSACTIONS_LIMIT),
+                    return_exceptions=True
+                )
 
             # Process results
             if not isinstance(results[0], Exception):
                 self.stats_overview = results[0]
             if not isinstance(results[1], Exception):
-                self.recent_transactions = [Transaction(**item) for item in results[1]]
+                self.system_health = results[1]
             if not isinstance(results[2], Exception):
-                self.system_health = results[2]
+                # Copy so the cached response is left untouched
+                self.system_metadata = {**results[2], "version": "1.1.0"}  # Force version upgrade
             if not isinstance(results[3], Exception):
-                self.system_metadata = results[3]
-                self.system_metadata["version"] = "1.1.0"  # Force version upgrade
+                self.recent_transactions = [RecentTransaction.from_api(item) for item in results[3]]
 
             self._update_cache_timestamp("dashboard")
         except Exception as e:
@@ -193,117 +633,117 @@ class AppState(rx.State):
         finally:
             self.is_loading = False
 
-    # ===== TRANSACTIONS METHODS =====
+    @rx.event(background=True)
+    async def watch_recent_transactions(self):
+        """Prepend transactions pushed by the API's event stream to the dashboard.
+
+        All tabs of a worker share one subscription to the stream, or one
+        poll of recent transactions when the API has no stream. This watcher
+        runs in the background until the dashboard unmounts, the tab stops
+        sending heartbeats or the stream closes.
+        """
+        watch_id = str(time.time_ns())
+        async with self:
+            self._recent_watch_id = watch_id
+            self._recent_heartbeat = time.time()
+            token = self.router.session.client_token
+        queue = await _watch_recent(token)
 
-    async def load_transactions(self):
-        """Load transactions with current filters."""
-        self.is_loading = True
-        self.error_message = ""
         try:
-            # Parse and validate filter values
-            min_amt = None
-            max_amt = None
-
-            if self.filter_min_amount:
+            while True:
                 try:
-                    min_amt = float(self.filter_min_amount)
-                except ValueError:
-                    self.error_message = "Invalid minimum amount"
-                    return
-
-            if self.filter_max_amount:
-                try:
-                    max_amt = float(self.filter_max_amount)
-                except ValueError:
-                    self.error_message = "Invalid maximum amount"
-                    return
-
-            result = await api_client.get_transactions(
-                page=self.current_page,
-                limit=self.items_per_page,
-                use_chip=self.filter_use_chip if self.filter_use_chip else None,
-                is_fraud=self.filter_is_fraud,
-                min_amount=min_amt,
-                max_amount=max_amt,
-                merchant_state=self.filter_merchant_state if self.filter_merchant_state else None
-            )
-            self.transactions = [Transaction(**item) for item in result.get("transactions", [])]
-            self.total_transactions = result.get("total", 0)
-        except Exception as e:
-            self.error_message = f"Error loading transactions: {str(e)}"
+                    item = await asyncio.wait_for(queue.get(), RECENT_WATCH_POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    # Nothing new: stop if the tab closed or left the dashboard
+                    async with self:
+                        if not self._is_watching_recent(watch_id):
+                            break
+                    continue
+                if item is None:
+                    break
+                transaction = RecentTransaction.from_api(item)
+                async with self:
+                    if not self._is_watching_recent(watch_id):
+                        break
+                    self.recent_transactions = (
+                        [transaction] + self.recent_transactions
+                    )[:RECENT_TRANSACTIONS_LIMIT]
+        except Exception:
+            # Malformed item: the dashboard picks it up on its next load
+            pass
         finally:
-            self.is_loading = False
-
-    async def load_transaction_types(self):
-        """Load available transaction types with caching."""
-        if self._is_cache_valid("transaction_types") and self.transaction_types:
-            return
-
-        try:
-            self.transaction_types = await api_client.get_transaction_types()
-            self._update_cache_timestamp("transaction_types")
-        except Exception as e:
-            self.error_message = f"Error loading transaction types: {str(e)}"
-
-    async def next_page(self):
-        """Go to next page of transactions."""
-        if self.items_per_page <= 0:
-            return
-        total_pages = (self.total_transactions + self.items_per_page - 1) // self.items_per_page
-        if self.current_page < total_pages:
-            self.current_page += 1
-            await self.load_transactions()
-
-    async def prev_page(self):
-        """Go to previous page of transactions."""
-        if self.current_page > 1:
-            self.current_page -= 1
-            await self.load_transactions()
+            await _unwatch_recent(token, queue)
+
+    def _is_watching_recent(self, watch_id: str) -> bool:
+        """Whether a watcher should keep updating this tab's dashboard."""
+        return (
+            self._recent_watch_id == watch_id
+            and self.router.page.path == "/"
+            and time.time() - self._recent_heartbeat < RECENT_WATCH_STALE_SECONDS
+        )
+
+    def keep_watching_recent_transactions(self, _value: str):
+        """Record that the dashboard is still open (fired periodically by the page)."""
+        self._recent_heartbeat = time.time()
+
+    def stop_watching_recent_transactions(self):
+        """Stop this tab's recent transactions watcher when the dashboard unmounts."""
+        self._recent_watch_id = ""
+        # Wake the watcher up if it runs in this worker
+        queue = _recent_watchers.get(self.router.session.client_token)
+        if queue is not None:
+            _offer_recent(queue, None)
 
     # ===== CUSTOMERS METHODS =====
 
-    async def load_customers(self):
-        """Load customers list with optimizations."""
+    async def _fetch_customers(self, page: int) -> Tuple[List[Customer], int]:
+        """Fetch one page of customers, then start prefetching the next one.
+
+        Args:
+            page: Page number to fetch
+
+        Returns:
+            Tuple of (customers, total customer count)
+        """
+        limit = self.items_per_page
+        customers, total = await _take_prefetched(
+            ("customers", page, limit),
+            lambda: _fetch_customers_page(page, limit)
+        )
+        if page * limit < total:
+            _prefetch(("customers", page + 1, limit), lambda: _fetch_customers_page(page + 1, limit))
+        return customers, total
+
+    async def _load_customers(self, page: int):
+        """Load a customers page into state, reporting errors in error_message.
+
+        Args:
+            page: Page number to load
+        """
         self.is_loading = True
         self.error_message = ""
         try:
-            result = await api_client.get_customers(
-                page=self.customers_page,
-                limit=self.items_per_page
-            )
-            raw_customers = result.get("customers", [])
-            customers_data = []
-
-            # Check if we got a list of IDs (int) instead of objects
-            if raw_customers and isinstance(raw_customers[0], int):
-                # Fetch details for each customer in parallel (batched)
-                tasks = [api_client.get_customer_profile(cid) for cid in raw_customers]
-                customers_data = await asyncio.gather(*tasks, return_exceptions=True)
-                # Filter out exceptions
-                customers_data = [c for c in customers_data if not isinstance(c, Exception)]
-            else:
-                customers_data = raw_customers
-
-            # Calculate avg_amount if missing
-            for item in customers_data:
-                if item and "avg_amount" not in item:
-                    count = item.get("transactions_count", 0)
-                    total = item.get("total_amount", 0.0)
-                    item["avg_amount"] = total / count if count > 0 else 0.0
-
-            self.customers = [Customer(**item) for item in customers_data if item]
-            self.total_customers = result.get("total", 0)
+            self.customers, self.total_customers = await self._fetch_customers(page)
         except Exception as e:
             self.error_message = f"Error loading customers: {str(e)}"
         finally:
             self.is_loading = False
 
+    async def load_customers_page(self):
+        """Load the current customers page on page mount."""
+        # Show the spinner (and clear a stale error) before the request goes out
+        self.is_loading = True
+        self.error_message = ""
+        yield
+        await self._load_customers(self.customers_page)
+
+    async def load_customers(self):
+        """Load customers list with optimizations."""
+        await self._load_customers(self.customers_page)
+
     async def next_customers_page(self):
         """Go to next page of customers."""
-        if self.items_per_page <= 0:
-            return
-        total_pages = (self.total_customers + self.items_per_page - 1) // self.items_per_page
-        if self.customers_page < total_pages:
+        if self.customers_page < self.customers_total_pages:
             self.customers_page += 1
             await self.load_customers()
 
@@ -313,35 +753,9 @@ class AppState(rx.State):
             self.customers_page -= 1
             await self.load_customers()
 
-    async def load_top_customers(self):
-        """Load top customers with caching."""
-        if self._is_cache_valid("top_customers") and self.top_customers:
-            return
-
-        try:
-            top_data = await api_client.get_top_customers(TOP_CUSTOMERS_LIMIT)
-
-            # Check if we got a list of IDs (int) instead of objects
-            if top_data and isinstance(top_data[0], int):
-                tasks = [api_client.get_customer_profile(cid) for cid in top_data]
-                top_data = await asyncio.gather(*tasks, return_exceptions=True)
-                top_data = [c for c in top_data if not isinstance(c, Exception)]
-
-            # Calculate avg_amount if missing
-            for item in top_data:
-                if item and "avg_amount" not in item:
-                    count = item.get("transactions_count", 0)
-                    total = item.get("total_amount", 0.0)
-                    item["avg_amount"] = total / count if count > 0 else 0.0
-
-            self.top_customers = [Customer(**item) for item in top_data if item]
-            self._update_cache_timestamp("top_customers")
-        except Exception as e:
-            self.error_message = f"Error loading top customers: {str(e)}"
-
     async def search_customer(self):
         """Search for a customer by ID."""
-        if not self.search_customer_id:
+        if not self.search_customer_id.strip():
             self.error_message = "Please enter a customer ID"
             return
 
@@ -350,12 +764,13 @@ class AppState(rx.State):
         try:
             # Validate ID is a number
             try:
-                customer_id = int(self.search_customer_id)
+                customer_id = int(self.search_customer_id.strip())
             except ValueError:
                 self.error_message = "Customer ID must be a number"
                 return
 
-            # Direct lookup
+            # Direct lookup; full profiles fetched recently (alone or for
+            # the customers page) come from the client's profile cache
             profile = await api_client.get_customer_profile(customer_id)
             if profile:
                 self.customer_profile = profile
@@ -367,7 +782,10 @@ class AppState(rx.State):
             self.is_loading = False
 
     async def load_customer_profile(self, customer_id: str):
-        """Load customer profile by ID."""
+        """Load customer profile by ID.
+
+        Profiles in the client's profile cache are served without a request.
+        """
         self.is_loading = True
         self.error_message = ""
         try:
@@ -377,65 +795,192 @@ class AppState(rx.State):
         finally:
             self.is_loading = False
 
-    # ===== FRAUD METHODS =====
+    # ===== STATS METHODS =====
 
-    async def load_fraud_data(self):
-        """Load fraud detection data with caching."""
-        if self._is_cache_valid("fraud") and self.fraud_summary:
+    async def load_stats_data(self):
+        """Load statistical data with caching."""
+        if self._is_cache_valid("stats") and self.amount_distribution:
             return
 
         self.is_loading = True
         self.error_message = ""
         try:
-            # Load both in parallel
+            # Load all stats in parallel
             results = await asyncio.gather(
-                api_client.get_fraud_summary(),
-                api_client.get_fraud_by_type(),
+                api_client.get_amount_distribution(AMOUNT_DISTRIBUTION_BINS),
+                api_client.get_stats_by_type(),
+                api_client.get_daily_stats(DAILY_STATS_LIMIT),
                 return_exceptions=True
             )
 
             if not isinstance(results[0], Exception):
-                self.fraud_summary = results[0]
+                self.amount_distribution = results[0]
             if not isinstance(results[1], Exception):
-                self.fraud_by_type = [FraudStat(**item) for item in results[1]]
-            
-            # Try to fetch recent transactions to update options if needed
-            # We do this silently to improve dropdown options
-            try:
-                tx_data = await api_client.get_transactions(limit=100)
-                transactions = tx_data.get("transactions", [])
-                
-                # Update states
-                found_states = {t.get("merchant_state") for t in transactions if t.get("merchant_state")}
-                current_states = set(self.merchant_states)
-                new_states = found_states - current_states
-                if new_states:
-                    self.merchant_states = sorted(list(current_states | new_states))
-                
-                # Update MCCs
-                found_mccs = {str(t.get("mcc")) for t in transactions if t.get("mcc")}
-                current_mccs = set(self.mcc_codes)
-                new_mccs = found_mccs - current_mccs
-                if new_mccs:
-                    self.mcc_codes = sorted(list(current_mccs | new_mccs))
-            except Exception:
-                # Ignore errors here as it's just an enhancement
-                pass
+                self.stats_by_type = [TypeStat.from_api(item) for item in results[1]]
+            if not isinstance(results[2], Exception):
+                self.daily_stats = [DailyStat.from_api(item) for item in results[2]]
+
+            self._update_cache_timestamp("stats")
+        except Exception as e:
+            self.error_message = f"Error loading stats: {str(e)}"
+        finally:
+            self.is_loading = False
+
+
+class LookupState(AppState):
+    """Dropdown options shared by the form pages.
 
+    The default options (US_STATES, COMMON_MCC_CODES) are static and are
+    compiled into the page; only values seen in the data on top of them
+    are kept in state.
+    """
+
+    # Form options missing from the static defaults
+    extra_merchant_states: List[str] = []
+    extra_mcc_codes: List[str] = []
+
+    # ===== CACHE HELPERS =====
+
+    def invalidate_dropdowns(self):
+        """Drop the cached dropdown options so the next page load refetches them."""
+        _response_cache.pop(DROPDOWN_OPTIONS_CACHE_KEY, None)
+        self.invalidate_cache("lookups")
+
+    # ===== LOOKUP METHODS =====
+
+    @rx.event(background=True)
+    async def load_lookups(self):
+        """Merge merchant states and MCC codes seen in recent data into the dropdowns.
+
+        Runs as a background event: a page's on_mount handlers are processed
+        one after the other, and this lets the sample be fetched at the same
+        time as the page's own data instead of after it.
+        """
+        async with self:
+            if self._is_cache_valid("lookups"):
+                return
+
+        try:
+            # Taken from a transaction sample, cached per process
+            found_states, found_mccs = await _get_cached(
+                DROPDOWN_OPTIONS_CACHE_KEY, _fetch_dropdown_options, DROPDOWN_OPTIONS_TTL_SECONDS
+            )
+        except Exception:
+            # Errors on the sample are ignored as it's just an enhancement
+            return
+
+        async with self:
+            merchant_states = _merge_options(self.extra_merchant_states, found_states)
+            if merchant_states is not None:
+                self.extra_merchant_states = merchant_states
+            mcc_codes = _merge_options(self.extra_mcc_codes, found_mccs)
+            if mcc_codes is not None:
+                self.extra_mcc_codes = mcc_codes
+            self._update_cache_timestamp("lookups")
+
+
+class FraudDataState(AppState):
+    """Fraud summary, per-type statistics and predictions."""
+
+    # Fraud data
+    fraud_summary: Dict[str, Any] = {}
+    fraud_by_type: List[FraudStat] = []
+    fraud_by_type_loading: bool = False
+    fraud_prediction: Dict[str, Any] = {}
+
+    # ===== COMPUTED VARS =====
+
+    @rx.var(cache=True)
+    def total_frauds_str(self) -> str:
+        """Total fraud count from the fraud summary."""
+        return str(self.fraud_summary.get("total_frauds", 0))
+
+    @rx.var(cache=True)
+    def fraud_summary_rate_str(self) -> str:
+        """Fraud rate from the fraud summary formatted as a percentage."""
+        return f"{float(self.fraud_summary.get('fraud_rate', 0) or 0) * 100:.2f}%"
+
+    @rx.var(cache=True)
+    def total_fraud_amount_str(self) -> str:
+        """Total fraudulent amount formatted as currency."""
+        return f"${float(self.fraud_summary.get('total_fraud_amount', 0) or 0):,.2f}"
+
+    @rx.var(cache=True)
+    def is_fraud_prediction(self) -> bool:
+        """Whether the last prediction classified the transaction as fraud."""
+        return bool(self.fraud_prediction.get("isFraud", False))
+
+    @rx.var(cache=True)
+    def fraud_probability_pct(self) -> str:
+        """Fraud probability of the last prediction formatted as a percentage."""
+        return f"{float(self.fraud_prediction.get('probability', 0) or 0) * 100:.1f}%"
+
+    @rx.var(cache=True)
+    def is_high_fraud_probability(self) -> bool:
+        """Whether the last prediction's fraud probability is above 50%."""
+        return float(self.fraud_prediction.get("probability", 0) or 0) > 0.5
+
+    # ===== FRAUD METHODS =====
+
+    async def load_fraud_summary(self):
+        """Load the fraud summary with caching."""
+        if self._is_cache_valid("fraud") and self.fraud_summary:
+            return
+
+        self.is_loading = True
+        self.error_message = ""
+        try:
+            self.fraud_summary = await api_client.get_fraud_summary(ttl=FRAUD_STATS_TTL_SECONDS)
             self._update_cache_timestamp("fraud")
         except Exception as e:
             self.error_message = f"Error loading fraud data: {str(e)}"
         finally:
             self.is_loading = False
 
+    async def load_fraud_by_type(self, visible: bool = True):
+        """Load fraud stats by transaction type once their section is on screen.
+
+        Args:
+            visible: Whether the section is currently in the viewport
+        """
+        if not visible:
+            return
+        if self._is_cache_valid("fraud_by_type") and self.fraud_by_type:
+            return
+
+        self.fraud_by_type_loading = True
+        yield
+        try:
+            result = await api_client.get_fraud_by_type(ttl=FRAUD_STATS_TTL_SECONDS)
+            self.fraud_by_type = [FraudStat.from_api(item) for item in result]
+            self._update_cache_timestamp("fraud_by_type")
+        except Exception as e:
+            self.error_message = f"Error loading fraud data: {str(e)}"
+        finally:
+            self.fraud_by_type_loading = False
+
     async def predict_fraud(
         self,
         amount: float,
         use_chip: str,
         merchant_state: str,
-        mcc: int
+        mcc: int,
+        force_refresh: bool = False
     ):
-        """Predict fraud for given transaction data."""
+        """Predict fraud for given transaction data.
+
+        Identical inputs are answered from a bounded LRU cache unless
+        force_refresh is set.
+        """
+        # Rounded before sending, so the cache key is exactly what is sent
+        amount = round(float(amount), 2)
+        key = (amount, use_chip, merchant_state, mcc)
+        if not force_refresh and key in _prediction_cache:
+            _prediction_cache.move_to_end(key)
+            self.error_message = ""
+            self.fraud_prediction = _prediction_cache[key]
+            return
+
         self.is_loading = True
         self.error_message = ""
         self.fraud_prediction = {}  # Clear previous prediction
@@ -447,38 +992,333 @@ class AppState(rx.State):
                 "mcc": mcc
             }
             self.fraud_prediction = await api_client.predict_fraud(data)
+            _prediction_cache[key] = self.fraud_prediction
+            _prediction_cache.move_to_end(key)
+            if len(_prediction_cache) > PREDICTION_CACHE_SIZE:
+                _prediction_cache.popitem(last=False)
         except Exception as e:
             self.error_message = f"Error predicting fraud: {str(e)}"
         finally:
             self.is_loading = False
 
-    # ===== STATS METHODS =====
 
-    async def load_stats_data(self):
-        """Load statistical data with caching."""
-        if self._is_cache_valid("stats") and self.amount_distribution:
+class TransactionsState(AppState):
+    """Transactions list, filters and pagination."""
+
+    # Transactions data
+    # Current page stored as parallel per-column lists, so each field name
+    # is sent once per column instead of once per row
+    txn_ids: List[str] = []
+    txn_dates: List[str] = []
+    txn_client_ids: List[int] = []
+    txn_amounts: List[str] = []
+    txn_amount_colors: List[str] = []
+    txn_use_chips: List[str] = []
+    txn_merchant_cities: List[str] = []
+    txn_merchant_states: List[str] = []
+    txn_fraud_labels: List[str] = []
+    txn_fraud_colors: List[str] = []
+    # Options of the type filter, replaced by the API's list once loaded
+    transaction_types: List[str] = TRANSACTION_TYPES
+    total_transactions: int = 0
+    current_page: int = 1
+    # Last transaction ID of each previous page, used as keyset cursors
+    # ("" when unknown, falling back to page offsets)
+    _cursor_stack: List[str] = []
+    # Page number of the rows currently shown (stale after a failed load)
+    _shown_page: int = 0
+    # Bumped by every transactions load, so an older, slower load can tell
+    # it was superseded and leave the newer page alone
+    _load_generation: int = 0
+    # Page key of the rows currently shown, to skip reloading the same page
+    _shown_page_key: Tuple = ()
+
+    # Filters
+    filter_use_chip: str = ""
+    filter_is_fraud: Optional[int] = None
+    filter_min_amount: str = ""
+    filter_max_amount: str = ""
+    filter_merchant_state: str = ""
+
+    # ===== COMPUTED VARS =====
+
+    @rx.var(cache=True)
+    def total_pages(self) -> int:
+        """Number of transactions pages for the current filters (at least 1)."""
+        return _total_pages(self.total_transactions, self.items_per_page)
+
+    @rx.var(cache=True)
+    def has_next_page(self) -> bool:
+        """Whether there is a transactions page after the current one."""
+        return self.current_page < self.total_pages
+
+    @rx.var(cache=True)
+    def has_prev_page(self) -> bool:
+        """Whether there is a transactions page before the current one."""
+        return self.current_page > 1
+
+    @rx.var(cache=True)
+    def page_label(self) -> str:
+        """Pagination caption for the transactions table."""
+        return f"Page {self.current_page} of {self.total_pages} | Total: {self.total_transactions} transactions"
+
+    # ===== SETTER METHODS FOR FILTERS =====
+
+    # Filters reload the first page as soon as they change. The text inputs
+    # are debounced on the client, so this runs once per typing pause rather
+    # than once per keystroke.
+
+    async def _restart_from_first_page(self):
+        """Go back to the first page so a changed filter reloads from the start."""
+        self.current_page = 1
+        self._cursor_stack = []
+        async for _ in self.load_transactions():
+            yield
+
+    async def set_filter_use_chip(self, value: str):
+        """Set transaction type filter and reload."""
+        value = value if value != "All" else ""
+        if value != self.filter_use_chip:
+            self.filter_use_chip = value
+            async for _ in self._restart_from_first_page():
+                yield
+
+    async def set_filter_min_amount(self, value: str):
+        """Set minimum amount filter and reload."""
+        if value != self.filter_min_amount:
+            self.filter_min_amount = value
+            async for _ in self._restart_from_first_page():
+                yield
+
+    async def set_filter_max_amount(self, value: str):
+        """Set maximum amount filter and reload."""
+        if value != self.filter_max_amount:
+            self.filter_max_amount = value
+            async for _ in self._restart_from_first_page():
+                yield
+
+    async def set_filter_merchant_state(self, value: str):
+        """Set merchant state filter and reload."""
+        if value != self.filter_merchant_state:
+            self.filter_merchant_state = value
+            async for _ in self._restart_from_first_page():
+                yield
+
+    async def set_filter_is_fraud(self, value: str):
+        """Set fraud filter from dropdown value and reload."""
+        if value == "Fraudulent":
+            is_fraud = 1
+        elif value == "Legitimate":
+            is_fraud = 0
+        else:
+            is_fraud = None
+        if is_fraud != self.filter_is_fraud:
+            self.filter_is_fraud = is_fraud
+            async for _ in self._restart_from_first_page():
+                yield
+
+    def reset_filters(self) -> bool:
+        """Reset all transaction filters.
+
+        Only values that differ from their default are written, so resetting
+        already-clear filters leaves the state untouched.
+
+        Returns:
+            Whether any filter or the page changed
+        """
+        changed = False
+        if self.filter_use_chip:
+            self.filter_use_chip = ""
+            changed = True
+        if self.filter_is_fraud is not None:
+            self.filter_is_fraud = None
+            changed = True
+        if self.filter_min_amount:
+            self.filter_min_amount = ""
+            changed = True
+        if self.filter_max_amount:
+            self.filter_max_amount = ""
+            changed = True
+        if self.filter_merchant_state:
+            self.filter_merchant_state = ""
+            changed = True
+        if self.current_page != 1:
+            self.current_page = 1
+            changed = True
+        if self._cursor_stack:
+            self._cursor_stack = []
+        return changed
+
+    async def reset_and_reload(self):
+        """Reset all filters and reload the first page in a single event.
+
+        Nothing is reloaded (and no delta sent) when the filters were already
+        clear and the first page is shown without error.
+        """
+        if not self.reset_filters() and self._shown_page == 1 and not self.error_message:
             return
+        async for _ in self.load_transactions():
+            yield
+
+    # ===== TRANSACTIONS METHODS =====
+
+    def _set_transaction_columns(self, rows: List[Transaction]):
+        """Store transactions as the per-column lists sent to the client.
+
+        Args:
+            rows: Transactions built with Transaction.from_api
+        """
+        self.txn_ids = [t.id for t in rows]
+        self.txn_dates = [t.date for t in rows]
+        self.txn_client_ids = [t.client_id for t in rows]
+        self.txn_amounts = [t.amount_display for t in rows]
+        self.txn_amount_colors = [t.amount_color for t in rows]
+        self.txn_use_chips = [t.use_chip or "" for t in rows]
+        self.txn_merchant_cities = [t.merchant_city or "" for t in rows]
+        self.txn_merchant_states = [t.merchant_state or "" for t in rows]
+        self.txn_fraud_labels = [t.fraud_label for t in rows]
+        self.txn_fraud_colors = [t.fraud_color for t in rows]
+
+    async def load_transactions(self):
+        """Load transactions with current filters.
 
+        A load superseded by a later one while fetching drops its rows.
+        """
+        self._load_generation += 1
+        generation = self._load_generation
         self.is_loading = True
         self.error_message = ""
         try:
-            # Load all stats in parallel
-            results = await asyncio.gather(
-                api_client.get_amount_distribution(AMOUNT_DISTRIBUTION_BINS),
-                api_client.get_stats_by_type(),
-                api_client.get_daily_stats(DAILY_STATS_LIMIT),
-                return_exceptions=True
-            )
+            # Parse and validate filter values
+            min_amt = None
+            max_amt = None
 
-            if not isinstance(results[0], Exception):
-                self.amount_distribution = results[0]
-            if not isinstance(results[1], Exception):
-                self.stats_by_type = [TypeStat(**item) for item in results[1]]
-            if not isinstance(results[2], Exception):
-                self.daily_stats = [DailyStat(**item) for item in results[2]]
+            if self.filter_min_amount:
+                try:
+                    min_amt = float(self.filter_min_amount)
+                except ValueError:
+                    self.error_message = "Invalid minimum amount"
+                    return
 
-            self._update_cache_timestamp("stats")
+            if self.filter_max_amount:
+                try:
+                    max_amt = float(self.filter_max_amount)
+                except ValueError:
+                    self.error_message = "Invalid maximum amount"
+                    return
+
+            query = dict(
+                page=self.current_page,
+                limit=self.items_per_page,
+                use_chip=self.filter_use_chip if self.filter_use_chip else None,
+                is_fraud=self.filter_is_fraud,
+                min_amount=min_amt,
+                max_amount=max_amt,
+                merchant_state=self.filter_merchant_state if self.filter_merchant_state else None,
+                after=self._cursor_stack[-1] or None if self._cursor_stack else None
+            )
+            key = _transactions_page_key(query)
+            cached = _cached_transactions_page(key)
+            if key == self._shown_page_key and cached is not None:
+                # Already showing this page and it is still fresh
+                return
+            if cached is not None:
+                # Same filters and page as a recent load (or a finished
+                # prefetch): no request needed
+                rows, self.total_transactions = cached
+                _prefetched_pages.pop(key, None)
+            else:
+                # Show the spinner while the page is fetched
+                yield
+                rows, total = await _take_prefetched(
+                    key, lambda: _fetch_transactions_page(query)
+                )
+                if generation != self._load_generation:
+                    # A newer page or filter set owns the table now
+                    return
+                self.total_transactions = total
+
+            # Fetch the next page in the background so next_page is instant
+            if rows and self.has_next_page:
+                next_query = {**query, "page": self.current_page + 1, "after": rows[-1].id}
+                next_key = _transactions_page_key(next_query)
+                if _cached_transactions_page(next_key) is None:
+                    _prefetch(next_key, lambda: _fetch_transactions_page(next_query))
+
+            # One assignment: Reflex sends a list var whole in each delta, so
+            # streaming the page in batches would resend every earlier row
+            # with each batch without showing the first rows any sooner
+            self._set_transaction_columns(rows)
+            self._shown_page_key = key
+            self._shown_page = self.current_page
         except Exception as e:
-            self.error_message = f"Error loading stats: {str(e)}"
+            if generation == self._load_generation:
+                self.error_message = f"Error loading transactions: {str(e)}"
         finally:
-            self.is_loading = False
+            if generation == self._load_generation:
+                self.is_loading = False
+
+    async def load_transaction_types(self):
+        """Load available transaction types with caching."""
+        if self._is_cache_valid("transaction_types"):
+            return
+
+        try:
+            self._set_transaction_types(await api_client.get_transaction_types(ttl=TRANSACTION_TYPES_TTL_SECONDS))
+        except Exception as e:
+            self.error_message = f"Error loading transaction types: {str(e)}"
+
+    def _set_transaction_types(self, transaction_types: List[str]):
+        """Store the type filter options fetched from the API.
+
+        Args:
+            transaction_types: Types returned by get_transaction_types
+        """
+        # Leave loaded types alone when unchanged, so no delta is sent
+        if transaction_types and transaction_types != self.transaction_types:
+            self.transaction_types = transaction_types
+        self._update_cache_timestamp("transaction_types")
+
+    async def load_transactions_page(self):
+        """Load the transactions page: its rows and the type filter options.
+
+        The type options are requested while the rows load. Only the API
+        call runs alongside; its result is applied here, within this event.
+        """
+        types_fetch = None
+        if not self._is_cache_valid("transaction_types"):
+            types_fetch = asyncio.ensure_future(
+                api_client.get_transaction_types(ttl=TRANSACTION_TYPES_TTL_SECONDS)
+            )
+        try:
+            async for _ in self.load_transactions():
+                yield
+        except BaseException:
+            if types_fetch is not None:
+                types_fetch.cancel()
+            raise
+        if types_fetch is not None:
+            try:
+                self._set_transaction_types(await types_fetch)
+            except Exception as e:
+                self.error_message = f"Error loading transaction types: {str(e)}"
+
+    async def next_page(self):
+        """Go to next page of transactions."""
+        if self.current_page < self.total_pages:
+            if self.txn_ids:
+                # The rows shown are only the current page's if its load succeeded
+                shown = self._shown_page == self.current_page
+                self._cursor_stack.append(self.txn_ids[-1] if shown else "")
+            self.current_page += 1
+            async for _ in self.load_transactions():
+                yield
+
+    async def prev_page(self):
+        """Go to previous page of transactions."""
+        if self.current_page > 1:
+            if self._cursor_stack:
+                self._cursor_stack.pop()
+            self.current_page -= 1
+            async for _ in self.load_transactions():
+                yield
@@ -0,0 +1,12 @@
+"""Shared fixtures for the test suite."""
+
+import pytest_asyncio
+from banking_app.services.api_client import APIClient
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def api_client():
+    """One client for the whole run, so its connections are reused."""
+    c = APIClient()
+    yield c
+    await c.close()
@@ -1,37 +1,48 @@
 """Integration tests for API Client."""
 
 import pytest
-from banking_app.services.api_client import APIClient
 
-@pytest.mark.asyncio
-async def test_api_connection():
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_api_connection(api_client):
     """Test that we can connect to the API."""
-    client = APIClient()
     try:
-        health = await client.get_health()
+        health = await api_client.get_health()
         assert "status" in health
     except Exception as e:
         pytest.skip(f"API not available: {e}")
 
-@pytest.mark.asyncio
-async def test_get_transactions():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_transactions(api_client):
     """Test fetching transactions."""
-    client = APIClient()
     try:
-        result = await client.get_transactions(limit=5)
+        result = await api_client.get_transactions(limit=5)
         assert "transactions" in result
         assert "total" in result
         assert len(result["transactions"]) <= 5
     except Exception as e:
         pytest.skip(f"API not available: {e}")
 
-@pytest.mark.asyncio
-async def test_get_stats_overview():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_stats_overview(api_client):
     """Test fetching stats overview."""
-    client = APIClient()
     try:
-        stats = await client.get_stats_overview()
+        stats = await api_client.get_stats_overview()
         assert "total_transactions" in stats
         assert "fraud_rate" in stats
     except Exception as e:
         pytest.skip(f"API not available: {e}")
+
+@pytest.mark.xfail(reason="The API does not send avg_amount yet; Customer.from_api computes it")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_customers_include_avg_amount(api_client):
+    """Test that customer payloads carry avg_amount, computed by the API."""
+    try:
+        result = await api_client.get_customers(limit=1)
+        customers = result["customers"]
+        if customers and isinstance(customers[0], int):
+            customers = await api_client.get_customer_profiles(customers)
+    except Exception as e:
+        pytest.skip(f"API not available: {e}")
+    assert customers
+    assert "avg_amount" in customers[0]
@@ -0,0 +1,19 @@
+"""Tests for building models from API payloads."""
+
+from banking_app.models import Customer, Transaction
+
+
+def test_from_api_coerces_string_numbers():
+    """Test that numbers sent as strings are converted before formatting."""
+    transaction = Transaction.from_api(
+        {"id": 1, "client_id": "7", "date": "2020-01-01", "amount": "-12.50", "isFraud": "1"}
+    )
+    assert transaction.amount == -12.5
+    assert transaction.amount_display == "$-12.50"
+    assert transaction.amount_color == "red.600"
+    assert transaction.fraud_label == "Fraud"
+
+    customer = Customer.from_api({"id": 7, "transactions_count": "4", "total_amount": "10"})
+    assert customer.transactions_count == 4
+    assert customer.total_amount_str == "$10.00"
+    assert customer.avg_amount_str == "$2.50"